@@ -177,7 +177,7 @@ export function PhaseExplainer({
             Flow (Director → Workers)
           </h3>
           <pre className="font-mono text-xs text-foreground">
-            {`Director (plan) → search_web | extract_facts | analyze_risks | map_connections | verify_sources
+            {`Director (plan) → search_web | extract_facts | analyze_risks | map_connections | verify_sources | analyze_all
          → state update → Director (next action or generate_report)`}
           </pre>
         </section>
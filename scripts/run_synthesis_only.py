@@ -56,15 +56,17 @@ def main() -> None:
     async def run() -> None:
         graph = ResearchGraph(output_dir=str(args.output))
         print("Running synthesis phase (entity_resolution → temporal → update_graph_db → graph_reasoning → report)...")
-        out_dict = await graph._synthesis_node(state.model_dump())
-        result = ResearchState.model_validate(out_dict)
+        try:
+            result = await graph._synthesis_node(state)
+        finally:
+            await graph.cleanup()
 
         args.output.mkdir(parents=True, exist_ok=True)
         safe_name = result.subject.full_name.replace(" ", "_").lower()
         safe_name = "".join(c for c in safe_name if c.isalnum() or c == "_")
 
         (args.output / f"{safe_name}_state.json").write_text(
-            json.dumps(out_dict, indent=2, default=str), encoding="utf-8"
+            json.dumps(result.model_dump(), indent=2, default=str), encoding="utf-8"
         )
         (args.output / f"{safe_name}_report.md").write_text(result.final_report or "No report", encoding="utf-8")
         entities_data = [
@@ -112,13 +112,13 @@ class EntityResolver:
         """Merge confirmed entity pairs and update connection references."""
         merged_count = 0
         entity_map: dict[str, str] = {}  # old_id -> new_id
+        # One id index for all pairs; merged-away entities leave it so later pairs naming them are skipped
+        by_id = {e.id: e for e in state.entities}
 
         for pair in confirmed:
-            a_id = pair.get("entity_a_id", "")
-            b_id = pair.get("entity_b_id", "")
-            a = state.get_entity_by_id(a_id)
-            b = state.get_entity_by_id(b_id)
-            if not a or not b:
+            a = by_id.get(pair.get("entity_a_id", ""))
+            b = by_id.get(pair.get("entity_b_id", ""))
+            if not a or not b or a is b:
                 continue
 
             # Merge b into a (keep a as the surviving entity)
@@ -130,9 +130,12 @@ class EntityResolver:
                 a.description = b.description
 
             entity_map[b.id] = a.id
-            state.entities = [e for e in state.entities if e.id != b.id]
+            del by_id[b.id]
             merged_count += 1
 
+        if merged_count:
+            state.entities = [e for e in state.entities if e.id not in entity_map]
+
         # Update connection references
         for conn in state.connections:
             if conn.source_entity_id in entity_map:
@@ -146,34 +146,34 @@ async def graph_reasoning_node(
     insights: list[dict[str, Any]] = list(state.get("graph_insights") or [])
     params = {"subject_name": subject_name}
 
-    for query_name, query_def in DISCOVERY_QUERIES.items():
-        try:
-            results = await neo4j_client.execute_read(
-                query_def["cypher"].strip(),
-                parameters=params,
-            )
-            if results:
-                insight = GraphInsight(
-                    query_name=query_name,
-                    description=query_def["description"],
-                    insight_type=query_def["insight_type"],
-                    results=[dict(r) for r in results],
-                    result_count=len(results),
-                )
-                insights.append(insight.model_dump())
-                logger.info(
-                    "graph_insight_found",
-                    query=query_name,
-                    result_count=len(results),
-                )
-            else:
-                logger.debug("graph_insight_empty", query=query_name)
-        except Exception as e:
+    # The discovery queries are independent reads; run them concurrently and report in definition order
+    results_by_query = await neo4j_client.bulk_read(
+        [(query_def["cypher"].strip(), params) for query_def in DISCOVERY_QUERIES.values()]
+    )
+    for (query_name, query_def), results in zip(DISCOVERY_QUERIES.items(), results_by_query, strict=True):
+        if isinstance(results, BaseException):
             logger.warning(
                 "graph_reasoning_query_failed",
                 query=query_name,
-                error=str(e),
+                error=str(results),
+            )
+            continue
+        if results:
+            insight = GraphInsight(
+                query_name=query_name,
+                description=query_def["description"],
+                insight_type=query_def["insight_type"],
+                results=[dict(r) for r in results],
+                result_count=len(results),
+            )
+            insights.append(insight.model_dump())
+            logger.info(
+                "graph_insight_found",
+                query=query_name,
+                result_count=len(results),
             )
+        else:
+            logger.debug("graph_insight_empty", query=query_name)
 
     total_insights = sum(i.get("result_count", 0) for i in insights)
     logger.info(
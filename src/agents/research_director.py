@@ -203,6 +203,7 @@ class ResearchDirector:
             "analyze_risks": AgentAction.ANALYZE_RISKS,
             "map_connections": AgentAction.MAP_CONNECTIONS,
             "verify_sources": AgentAction.VERIFY_SOURCES,
+            "analyze_all": AgentAction.ANALYZE_ALL,
             "generate_report": AgentAction.GENERATE_REPORT,
             "terminate": AgentAction.TERMINATE,
         }
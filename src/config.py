@@ -8,12 +8,13 @@ Pydantic Settings provides validation and type coercion.
 from __future__ import annotations
 
 import os
+from collections.abc import Mapping
 from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from typing import Any, TypeVar
 
 from dotenv import load_dotenv
-from pydantic import Field
+from pydantic import BaseModel, Field, field_validator
 from pydantic_settings import BaseSettings
 
 # Load .env then .env.local (so .env.local overrides). Use override=True so file wins over shell.
@@ -53,6 +54,12 @@ class LLMConfig(BaseSettings):
         description="LiteLLM proxy base URL (OpenAI-compatible). Required for LiteLLM in deployment; if unset or localhost, direct provider keys are used.",
     )
 
+    @field_validator("litellm_api_base", mode="before")
+    @classmethod
+    def _strip_api_base(cls, v: Any) -> Any:
+        """Normalize whitespace once at load so callers never re-strip the URL."""
+        return v.strip() if isinstance(v, str) else v
+
     anthropic_api_key: str = Field(default="", alias="ANTHROPIC_API_KEY")
     openai_api_key: str = Field(default="", alias="OPENAI_API_KEY")
     google_api_key: str = Field(default="", alias="GOOGLE_API_KEY")
@@ -103,6 +110,12 @@ class Neo4jConfig(BaseSettings):
     username: str = Field(default="neo4j", alias="NEO4J_USERNAME")
     password: str = Field(default="", alias="NEO4J_PASSWORD")
     database: str = "neo4j"
+    # Driver connection pool: connections are reused across queries instead of re-handshaking per call
+    pool_size: int = Field(default=50, alias="NEO4J_POOL_SIZE")
+    connection_acquisition_timeout: float = Field(default=60.0, alias="NEO4J_CONNECTION_ACQUISITION_TIMEOUT")
+    connection_timeout: float = Field(default=10.0, alias="NEO4J_CONNECTION_TIMEOUT")
+    max_transaction_retry_time: float = Field(default=15.0, alias="NEO4J_MAX_TRANSACTION_RETRY_TIME")
+    keep_alive: bool = True
 
 
 class AgentConfig(BaseSettings):
@@ -121,6 +134,10 @@ class AgentConfig(BaseSettings):
     # Diminishing returns: min new entities in last N iterations to continue
     diminishing_returns_min_entities: int = 2
     diminishing_returns_lookback_iterations: int = 2
+    # Max analysis workers (risk / connections / sources) running at once in the combined analysis step
+    max_concurrent_agents: int = Field(default=3, alias="MAX_CONCURRENT_AGENTS")
+    # In-memory checkpoints are kept for the N most recent investigations (for resume/recovery), older ones dropped
+    max_checkpoint_threads: int = Field(default=8, alias="MAX_CHECKPOINT_THREADS")
 
 
 class ObservabilityConfig(BaseSettings):
@@ -152,9 +169,11 @@ class YAMLConfigLoader:
         path = self._dir / filename
         if not path.exists():
             return {}
+        # libyaml's C loader decodes raw bytes itself; fall back to the pure-Python loader without it.
+        loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
         try:
-            with open(path, encoding="utf-8") as f:
-                data = yaml.safe_load(f)
+            with open(path, "rb") as f:
+                data = yaml.load(f, Loader=loader)  # noqa: S506 — SafeLoader / CSafeLoader only
             return data if isinstance(data, dict) else {}
         except Exception:
             return {}
@@ -176,10 +195,41 @@ class Settings(BaseSettings):
     risk_categories: dict[str, Any] = Field(default_factory=dict)
 
 
+_ConfigT = TypeVar("_ConfigT", bound=BaseSettings)
+
+
+def _from_env(config_cls: type[_ConfigT], env: Mapping[str, str], **extra: Any) -> _ConfigT:
+    """Validate a config section against a lowercased env snapshot.
+
+    Calls BaseModel.__init__ directly so BaseSettings does not rebuild its sources (and
+    rescan os.environ) for every section. Matching mirrors BaseSettings: alias or field
+    name, case-insensitive.
+    """
+    values: dict[str, Any] = {}
+    for name, info in config_cls.model_fields.items():
+        key = info.alias or name
+        if key.lower() in env:
+            values[key] = env[key.lower()]
+    values.update(extra)
+    section = config_cls.__new__(config_cls)
+    BaseModel.__init__(section, **values)
+    return section
+
+
 @lru_cache(maxsize=1)
 def get_settings() -> Settings:
     """Singleton settings instance. Cached after first call."""
-    settings = Settings()
+    # One pass over os.environ, shared by every section.
+    env = {k.lower(): v for k, v in os.environ.items()}
+    settings = _from_env(
+        Settings,
+        {},
+        llm=_from_env(LLMConfig, env),
+        search=_from_env(SearchConfig, env),
+        neo4j=_from_env(Neo4jConfig, env),
+        agent=_from_env(AgentConfig, env),
+        observability=_from_env(ObservabilityConfig, env),
+    )
     loader = YAMLConfigLoader()
     settings.source_authority = loader.load("source_authority.yaml")
     settings.domain_policies = loader.load("domain_policies.yaml")
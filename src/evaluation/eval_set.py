@@ -11,7 +11,11 @@ Each persona includes expected facts the agent should discover, scored by diffic
 
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass, field
+from functools import cache
+from pathlib import Path
+from typing import Any
 
 
 def _depth_from_difficulty(difficulty: str) -> int:
@@ -20,7 +24,7 @@ def _depth_from_difficulty(difficulty: str) -> int:
     return m.get(difficulty.lower(), 3)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ExpectedFact:
     """A single fact the agent should discover."""
 
@@ -30,13 +34,65 @@ class ExpectedFact:
     source_hint: str = ""  # Where this fact can typically be found
     weight: float = 1.0  # Importance weighting for scoring
     depth: int = 0  # 1-5; 0 = derive from difficulty (surface=1, moderate=2, deep=3, hidden=4)
-    search_keywords: list[str] = field(default_factory=list)  # Optional keywords for matching
+    search_keywords: tuple[str, ...] = ()  # Optional keywords for matching
+    # Derived once at construction for the scoring loop
+    key_terms: tuple[str, ...] = field(init=False, repr=False, compare=False)
+    resolved_depth: int = field(init=False, repr=False, compare=False)
+    depth_weight: float = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Frozen: derived fields are set once here via object.__setattr__.
+        # Terms are interned so term lookups during scoring hit the identity fast path.
+        key_terms = (
+            tuple(sys.intern(k.lower()) for k in self.search_keywords)
+            if self.search_keywords
+            else tuple(sys.intern(t.lower()) for t in self.claim.split() if len(t) > 3)
+        )
+        resolved_depth = self.effective_depth()
+        object.__setattr__(self, "key_terms", key_terms)
+        object.__setattr__(self, "resolved_depth", resolved_depth)
+        object.__setattr__(self, "depth_weight", resolved_depth / 5.0)
 
     def effective_depth(self) -> int:
         return self.depth if self.depth >= 1 else _depth_from_difficulty(self.difficulty)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
+class CompiledPersona:
+    """Column-wise view of a persona's facts (one entry per fact, in order) for the scoring loop."""
+
+    claims: tuple[str, ...]
+    term_counts: tuple[int, ...]  # number of key terms per fact (repeats included)
+    depths: tuple[int, ...]
+    weights: tuple[float, ...]
+    total_weight: float
+    # Distinct key terms across all facts, so the corpus can be scanned once per persona
+    key_terms: tuple[str, ...]
+    key_terms_utf8: tuple[bytes, ...]
+    # Distinct term -> indices of the facts using it (once per occurrence)
+    term_facts: dict[str, tuple[int, ...]]
+
+    @classmethod
+    def from_facts(cls, facts: tuple[ExpectedFact, ...]) -> CompiledPersona:
+        weights = tuple(ef.depth_weight for ef in facts)
+        term_facts: dict[str, list[int]] = {}
+        for i, ef in enumerate(facts):
+            for t in ef.key_terms:
+                term_facts.setdefault(t, []).append(i)
+        key_terms = tuple(term_facts)
+        return cls(
+            claims=tuple(ef.claim for ef in facts),
+            term_counts=tuple(len(ef.key_terms) for ef in facts),
+            depths=tuple(ef.resolved_depth for ef in facts),
+            weights=weights,
+            total_weight=sum(weights),
+            key_terms=key_terms,
+            key_terms_utf8=tuple(t.encode("utf-8") for t in key_terms),
+            term_facts={t: tuple(idx) for t, idx in term_facts.items()},
+        )
+
+
+@dataclass(slots=True)
 class TestPersona:
     """A test persona with ground-truth evaluation data."""
 
@@ -45,364 +101,80 @@ class TestPersona:
     current_org: str
     difficulty: str  # easy, medium, hard
     description: str
-    expected_facts: list[ExpectedFact] = field(default_factory=list)
-    expected_entities: list[str] = field(default_factory=list)
-    expected_risk_flags: list[str] = field(default_factory=list)
-    # (source, target, rel)
-    expected_connections: list[tuple[str, str, str]] = field(default_factory=list)
+    expected_facts: tuple[ExpectedFact, ...] = ()
+    expected_entities: tuple[str, ...] = ()
+    expected_risk_flags: tuple[str, ...] = ()
+    # (source, target, rel) triples; a set so membership checks are hash lookups
+    expected_connections: frozenset[tuple[str, str, str]] = field(default_factory=frozenset)
+    compiled: CompiledPersona = field(init=False, repr=False, compare=False)
+    expected_entities_lower: tuple[str, ...] = field(init=False, repr=False, compare=False)
 
-
-# ═══════════════════════════════════════════════════════════
-# Persona 1: Easy — Well-known tech figure
-# ═══════════════════════════════════════════════════════════
-
-PERSONA_EASY = TestPersona(
-    name="Jensen Huang",
-    current_role="CEO",
-    current_org="NVIDIA",
-    difficulty="easy",
-    description="Highly public tech CEO, abundant information across all categories",
-    expected_facts=[
-        ExpectedFact(
-            "Born February 17, 1963 in Tainan, Taiwan",
-            "biographical",
-            "surface",
-            "Wikipedia",
-        ),
-        ExpectedFact("Co-founded NVIDIA in 1993", "corporate", "surface", "Company website"),
-        ExpectedFact(
-            "Holds BSEE from Oregon State University",
-            "biographical",
-            "surface",
-            "Wikipedia",
-        ),
-        ExpectedFact(
-            "Holds MSEE from Stanford University",
-            "biographical",
-            "surface",
-            "Wikipedia",
-        ),
-        ExpectedFact(
-            "Worked at LSI Logic and AMD before NVIDIA",
-            "biographical",
-            "moderate",
-            "News articles",
-        ),
-        ExpectedFact(
-            "NVIDIA market cap exceeded $3 trillion in 2024",
-            "financial",
-            "surface",
-            "Financial news",
-        ),
-        ExpectedFact(
-            "Board member at various organizations",
-            "network",
-            "moderate",
-            "SEC filings",
-        ),
-        ExpectedFact("Known for leather jacket trademark style", "digital", "surface", "Media"),
-        ExpectedFact(
-            "NVIDIA pivoted from gaming to AI computing",
-            "corporate",
-            "moderate",
-            "Business analysis",
-        ),
-        ExpectedFact("Recipient of multiple industry awards", "biographical", "moderate", "News"),
-    ],
-    expected_entities=[
-        "NVIDIA",
-        "Stanford University",
-        "Oregon State University",
-        "LSI Logic",
-        "AMD",
-        "TSMC",
-    ],
-    expected_risk_flags=[],
-    expected_connections=[
-        ("Jensen Huang", "NVIDIA", "FOUNDED"),
-        ("Jensen Huang", "Stanford University", "PREVIOUSLY_AT"),
-    ],
-)
-
-
-# ═══════════════════════════════════════════════════════════
-# Persona 2: Medium — PE/VC fund manager
-# ═══════════════════════════════════════════════════════════
-
-PERSONA_MEDIUM = TestPersona(
-    name="Michael Moritz",
-    current_role="Partner",
-    current_org="Sequoia Capital",
-    difficulty="medium",
-    description="Well-known VC but with deeper corporate structure and philanthropy to trace",
-    expected_facts=[
-        ExpectedFact("Born in Cardiff, Wales", "biographical", "surface", "Wikipedia"),
-        ExpectedFact(
-            "Former journalist at Time magazine",
-            "biographical",
-            "moderate",
-            "News archives",
-        ),
-        ExpectedFact(
-            "Led investments in Google, Yahoo, PayPal, LinkedIn",
-            "financial",
-            "surface",
-            "Sequoia",
-        ),
-        ExpectedFact(
-            "Knight Commander of the Order of the British Empire (KBE)",
-            "biographical",
-            "moderate",
-            "UK honors",
-        ),
-        ExpectedFact(
-            "Major philanthropic donations through Crankstart Foundation",
-            "financial",
-            "deep",
-            "Tax filings",
-        ),
-        ExpectedFact("Married to Harriet Heyman", "biographical", "moderate", "Society pages"),
-        ExpectedFact(
-            "Diagnosed with rare medical condition, stepped back from active role",
-            "biographical",
-            "deep",
-            "News",
-        ),
-        ExpectedFact(
-            "Author of 'The Little Kingdom' about Apple Computer",
-            "digital",
-            "moderate",
-            "Publishing records",
-        ),
-        ExpectedFact("Oxford University education", "biographical", "surface", "Wikipedia"),
-        ExpectedFact("Wharton MBA", "biographical", "surface", "Wikipedia"),
-    ],
-    expected_entities=[
-        "Sequoia Capital",
-        "Google",
-        "Yahoo",
-        "PayPal",
-        "LinkedIn",
-        "Crankstart Foundation",
-        "Time Magazine",
-        "Oxford University",
-    ],
-    expected_risk_flags=[],
-    expected_connections=[
-        ("Michael Moritz", "Sequoia Capital", "WORKS_AT"),
-        ("Michael Moritz", "Crankstart Foundation", "FOUNDED"),
-        ("Sequoia Capital", "Google", "INVESTED_IN"),
-    ],
-)
+    def __post_init__(self) -> None:
+        self.compiled = CompiledPersona.from_facts(self.expected_facts)
+        self.expected_entities_lower = tuple(e.lower() for e in self.expected_entities)
 
 
 # ═══════════════════════════════════════════════════════════
-# Persona 3: Hard — The actual assessment target (Timothy Overturf)
+# Evaluation Set Registry
 # ═══════════════════════════════════════════════════════════
-# Populated with representative expected facts/entities so the evaluation
-# harness can run. Candidate should extend with manually verified ground
-# truth from pre-research (SEC, court records, LinkedIn, company site).
-
-PERSONA_HARD = TestPersona(
-    name="Timothy Overturf",
-    current_role="CEO",
-    current_org="Sisu Capital",
-    difficulty="hard",
-    description="Lower-profile finance executive — tests deep research capability",
-    expected_facts=[
-        ExpectedFact("CEO of Sisu Capital", "corporate", "surface", "Company website/LinkedIn"),
-        ExpectedFact(
-            "Professional background in finance or investment management",
-            "biographical",
-            "surface",
-            "LinkedIn",
-        ),
-        ExpectedFact(
-            "Sisu Capital is an investment or asset management firm",
-            "corporate",
-            "surface",
-            "Company website",
-        ),
-        ExpectedFact("LinkedIn profile or professional presence", "digital", "surface", "LinkedIn"),
-        ExpectedFact("Any prior executive or board roles", "network", "moderate", "SEC filings, news"),
-        ExpectedFact("Education or credentials if publicly stated", "biographical", "moderate", "LinkedIn, press"),
-        ExpectedFact("Fund strategy or AUM if disclosed", "financial", "deep", "Regulatory filings"),
-        ExpectedFact(
-            "Regulatory registrations or filings for Sisu Capital",
-            "corporate",
-            "deep",
-            "SEC, state regulators",
-        ),
-        # Deep/hidden facts aligned with SEC and regulatory record (depth 4-5)
-        ExpectedFact(
-            "SEC enforcement or civil action against Sisu Capital or Timothy Overturf",
-            "legal",
-            "hidden",
-            "SEC.gov litigation releases",
-            depth=4,
-            search_keywords=["SEC", "Sisu Capital", "enforcement", "3:23-cv", "03855"],
-        ),
-        ExpectedFact(
-            "Hansueli Overturf or Hans Overturf connected to Sisu Capital or Timothy",
-            "network",
-            "hidden",
-            "SEC complaint, DFPI orders",
-            depth=4,
-            search_keywords=["Hansueli Overturf", "Hans Overturf", "Sisu Capital"],
-        ),
-        ExpectedFact(
-            "Fiduciary duty breach or Investment Advisers Act violation",
-            "legal",
-            "hidden",
-            "SEC complaint",
-            depth=5,
-            search_keywords=["fiduciary", "Investment Advisers Act", "206(1)", "206(2)"],
-        ),
-        ExpectedFact(
-            "California DFPI or state regulatory action or suspension",
-            "legal",
-            "hidden",
-            "DFPI/DBO orders",
-            depth=5,
-            search_keywords=["DFPI", "California", "suspension", "desist", "Overturf"],
-        ),
-        ExpectedFact(
-            "Sisu Capital registered investment adviser or RIA",
-            "corporate",
-            "deep",
-            "SEC IAPD, Form ADV",
-            depth=3,
-            search_keywords=["Sisu Capital", "RIA", "investment adviser", "ADV"],
-        ),
-        ExpectedFact(
-            "Northern District of California or N.D. Cal. court case",
-            "legal",
-            "hidden",
-            "PACER, SEC litigation release",
-            depth=5,
-            search_keywords=["Northern District", "3:2023-cv", "San Francisco"],
-        ),
-        ExpectedFact(
-            "Client account misuse or self-dealing or unsuitable trading",
-            "legal",
-            "hidden",
-            "SEC complaint allegations",
-            depth=5,
-            search_keywords=["self-dealing", "unsuitable", "client accounts", "disgorgement"],
-        ),
-    ],
-    expected_entities=[
-        "Sisu Capital",
-        "Timothy Overturf",
-        "Hansueli Overturf",
-        "Hans Overturf",
-    ],
-    expected_risk_flags=["SEC", "regulatory", "litigation", "fiduciary"],
-    expected_connections=[
-        ("Timothy Overturf", "Sisu Capital", "WORKS_AT"),
-        ("Timothy Overturf", "Sisu Capital", "FOUNDED"),
-        ("Hansueli Overturf", "Timothy Overturf", "FAMILY_OF"),
-    ],
-)
 
+# Persona ground truth lives in config/eval_personas.yaml; nothing is read or built until
+# an evaluation actually runs.
+_PERSONAS_FILE = Path(__file__).resolve().parents[2] / "config" / "eval_personas.yaml"
 
-# ═══════════════════════════════════════════════════════════
-# Persona: Easy — Sam Altman (OpenAI)
-# ═══════════════════════════════════════════════════════════
-
-PERSONA_EASY_SAM = TestPersona(
-    name="Sam Altman",
-    current_role="CEO",
-    current_org="OpenAI",
-    difficulty="easy",
-    description="High-profile tech CEO, abundant public information",
-    expected_facts=[
-        ExpectedFact("Co-founded Loopt, sold to Green Dot", "corporate", "moderate", "Tech news"),
-        ExpectedFact("President of Y Combinator (2014–2019)", "corporate", "surface", "YC, Wikipedia"),
-        ExpectedFact("CEO of OpenAI", "corporate", "surface", "OpenAI website"),
-        ExpectedFact("Studied at Stanford University (dropped out)", "biographical", "surface", "Wikipedia"),
-        ExpectedFact("Led OpenAI through ChatGPT release and partnership with Microsoft", "corporate", "surface", "News"),
-        ExpectedFact("Worldcoin / Tools for Humanity involvement", "corporate", "moderate", "News"),
-        ExpectedFact("Testified before US Congress on AI regulation", "legal", "surface", "Congress, news"),
-    ],
-    expected_entities=[
-        "OpenAI",
-        "Y Combinator",
-        "Stanford University",
-        "Microsoft",
-        "Loopt",
-        "Worldcoin",
-    ],
-    expected_risk_flags=[],
-    expected_connections=[
-        ("Sam Altman", "OpenAI", "CEO"),
-        ("Sam Altman", "Y Combinator", "PRESIDENT"),
-    ],
-)
 
+def _build_fact(spec: dict[str, Any]) -> ExpectedFact:
+    return ExpectedFact(**{**spec, "search_keywords": tuple(spec.get("search_keywords", ()))})
 
-# ═══════════════════════════════════════════════════════════
-# Persona: Medium — Adam Neumann (WeWork)
-# ═══════════════════════════════════════════════════════════
 
-PERSONA_MEDIUM_ADAM = TestPersona(
-    name="Adam Neumann",
-    current_role="Co-founder, former CEO",
-    current_org="WeWork",
-    difficulty="medium",
-    description="High-visibility executive with corporate governance and fall from grace narrative",
-    expected_facts=[
-        ExpectedFact("Co-founded WeWork with Miguel McKelvey", "corporate", "surface", "WeWork, news"),
-        ExpectedFact("WeWork attempted IPO in 2019, valuation collapsed", "financial", "surface", "SEC, news"),
-        ExpectedFact("Stepped down as WeWork CEO in 2019", "corporate", "surface", "News"),
-        ExpectedFact("SoftBank was major investor in WeWork", "financial", "surface", "News"),
-        ExpectedFact("Israeli-American, served in Israeli Navy", "biographical", "moderate", "Wikipedia, interviews"),
-        ExpectedFact("Founded Flow (real estate) and received investment from a16z", "corporate", "moderate", "News"),
-        ExpectedFact("WeWork filed for bankruptcy in 2023", "corporate", "surface", "News"),
-        ExpectedFact("Controversy over self-dealing and governance at WeWork", "legal", "deep", "SEC, news"),
-    ],
-    expected_entities=[
-        "WeWork",
-        "SoftBank",
-        "Flow",
-        "Miguel McKelvey",
-        "Andreessen Horowitz",
-    ],
-    expected_risk_flags=["governance", "IPO", "valuation"],
-    expected_connections=[
-        ("Adam Neumann", "WeWork", "CO_FOUNDED"),
-        ("Adam Neumann", "WeWork", "CEO"),
-        ("SoftBank", "WeWork", "INVESTED_IN"),
-    ],
-)
+def _build_persona(spec: dict[str, Any]) -> TestPersona:
+    return TestPersona(
+        name=spec["name"],
+        current_role=spec["current_role"],
+        current_org=spec["current_org"],
+        difficulty=spec["difficulty"],
+        description=spec["description"],
+        expected_facts=tuple(_build_fact(fact) for fact in spec["expected_facts"]),
+        expected_entities=tuple(spec["expected_entities"]),
+        expected_risk_flags=tuple(spec["expected_risk_flags"]),
+        expected_connections=frozenset(tuple(c) for c in spec["expected_connections"]),
+    )
 
 
-# ═══════════════════════════════════════════════════════════
-# Evaluation Set Registry
-# ═══════════════════════════════════════════════════════════
+@cache
+def all_personas() -> tuple[TestPersona, ...]:
+    """All evaluation personas, constructed once on first use.
 
-ALL_PERSONAS = [
-    PERSONA_EASY,
-    PERSONA_EASY_SAM,
-    PERSONA_MEDIUM,
-    PERSONA_MEDIUM_ADAM,
-    PERSONA_HARD,
-]
+    Unlike the runtime config files, ground truth has no usable default: a missing or malformed
+    file raises instead of yielding an empty set (and the failure is not cached).
+    """
+    import yaml
 
-# Difficulty shortcut -> first persona at that difficulty (for --persona easy/medium/hard)
-PERSONA_BY_DIFFICULTY = {
-    "easy": PERSONA_EASY,
-    "medium": PERSONA_MEDIUM,
-    "hard": PERSONA_HARD,
-}
+    # libyaml's C loader decodes raw bytes itself; fall back to the pure-Python loader without it.
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    with open(_PERSONAS_FILE, "rb") as f:
+        data = yaml.load(f, Loader=loader)  # noqa: S506 — SafeLoader / CSafeLoader only
+    specs = data.get("personas") if isinstance(data, dict) else None
+    if not specs:
+        raise ValueError(f"{_PERSONAS_FILE} defines no personas")
+    return tuple(_build_persona(spec) for spec in specs)
 
 
 def get_persona(name: str) -> TestPersona | None:
     """Look up a test persona by name or by difficulty (easy / medium / hard)."""
     key = name.strip().lower()
-    if key in PERSONA_BY_DIFFICULTY:
-        return PERSONA_BY_DIFFICULTY[key]
-    for p in ALL_PERSONAS:
+    personas = all_personas()
+    if key in ("easy", "medium", "hard"):
+        # Difficulty shortcut -> first persona at that difficulty
+        return next((p for p in personas if p.difficulty == key), None)
+    for p in personas:
         if p.name.lower() == key:
             return p
     return None
+
+
+def __getattr__(name: str) -> Any:
+    # Backwards-compatible lazy access to the old module-level registry.
+    if name == "ALL_PERSONAS":
+        return all_personas()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
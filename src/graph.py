@@ -2,24 +2,32 @@
 LangGraph State Machine — core orchestration graph.
 
 Research Director supervises and routes to specialized workers.
-State is passed as dict; we serialize/deserialize ResearchState at each node.
+The ResearchState object is passed from node to node as-is; nodes mutate and return it.
 """
 
 from __future__ import annotations
 
-import json
-import re
+import asyncio
+import contextlib
+import functools
+import os
 import time
-from collections.abc import Callable
+from collections import Counter, OrderedDict
+from collections.abc import Awaitable, Callable
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any
+from typing import Any, BinaryIO
 
+import orjson
 import structlog
-from langchain_core.tracers.context import tracing_v2_enabled
+from langchain_core.runnables import RunnableConfig
+from langgraph.checkpoint.base import ChannelVersions, Checkpoint, CheckpointMetadata
 from langgraph.checkpoint.memory import MemorySaver
+from langgraph.checkpoint.serde.jsonplus import JsonPlusSerializer
 from langgraph.graph import END, StateGraph
 
+from src import models as state_models
 from src.agents.connection_mapper import ConnectionMappingAgent
 from src.agents.entity_resolver import EntityResolver
 from src.agents.fact_extractor import FactExtractionAgent
@@ -41,11 +49,119 @@ from src.tools.search import SearchOrchestrator
 logger = structlog.get_logger()
 
 
+# Enum .value goes through a descriptor; the hot-path logging and progress events use these lookups instead
+_ACTION_VALUE = {a: a.value for a in AgentAction}
+_PHASE_VALUE = {p: p.value for p in SearchPhase}
+
+
+class _SlugTable(dict[int, int]):
+    """str.translate table: slug characters map to themselves, anything else is dropped."""
+
+    def __missing__(self, key: int) -> None:
+        return None
+
+
+_SLUG_TABLE = _SlugTable({ord(c): ord(c) for c in "abcdefghijklmnopqrstuvwxyz0123456789_"})
+
+
 def _subject_slug(name: str) -> str:
     """Slug from subject name; matches frontend subjectToSlug for progress file and stream route."""
-    s = name.strip().lower()
-    s = re.sub(r"\s+", "_", s)
-    return re.sub(r"[^a-z0-9_]", "", s)
+    # str.split() trims and collapses whitespace runs in one pass; translate then drops non-slug chars
+    return "_".join(name.lower().split()).translate(_SLUG_TABLE)
+
+
+def _encode_json(data: Any, *, pretty: bool = True) -> bytes:
+    """JSON bytes via orjson (no intermediate str); compact output is a few times faster than indented."""
+    option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if pretty else 0)
+    return orjson.dumps(data, default=str, option=option)
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    """Write via a temp file, fsync, and rename into place, so readers never see a partially written file."""
+    tmp = path.with_name(path.name + ".tmp")
+    with open(tmp, "wb") as fh:
+        fh.write(data)
+        fh.flush()
+        os.fsync(fh.fileno())
+    os.replace(tmp, path)
+
+
+def _checkpoint_serializer() -> JsonPlusSerializer:
+    """Checkpoint serde allowed to restore the state models (ResearchState and its nested types)."""
+    state_types = [
+        obj for obj in vars(state_models).values() if isinstance(obj, type) and obj.__module__ == state_models.__name__
+    ]
+    return JsonPlusSerializer(allowed_msgpack_modules=state_types)
+
+
+class BoundedMemorySaver(MemorySaver):
+    """MemorySaver that keeps only the most recently written ``max_threads`` threads.
+
+    A plain MemorySaver holds every thread's checkpoints for the life of the process; one ResearchGraph
+    serving many investigations would grow without bound. Older threads are dropped on write (LRU).
+    """
+
+    def __init__(self, *, max_threads: int, serde: JsonPlusSerializer | None = None) -> None:
+        super().__init__(serde=serde)
+        self.max_threads = max(1, max_threads)
+        self._threads: OrderedDict[str, None] = OrderedDict()
+
+    def put(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions,
+    ) -> RunnableConfig:
+        thread_id = str(config["configurable"]["thread_id"])
+        saved = super().put(config, checkpoint, metadata, new_versions)
+        self._threads[thread_id] = None
+        self._threads.move_to_end(thread_id)
+        while len(self._threads) > self.max_threads:
+            evicted, _ = self._threads.popitem(last=False)
+            self.delete_thread(evicted)
+            logger.debug("checkpoint_thread_evicted", thread_id=evicted)
+        return saved
+
+    def delete_thread(self, thread_id: str) -> None:
+        self._threads.pop(str(thread_id), None)
+        super().delete_thread(thread_id)
+
+
+_NodeFn = Callable[..., Awaitable[ResearchState]]
+
+
+def _instrumented(node: str) -> Callable[[_NodeFn], _NodeFn]:
+    """Wrap a node method with its observability sinks, so the body only holds the node's own work.
+
+    On entry: pipeline-debug "in" dump, node_start SSE event, node_stage_start log.
+    On exit: pipeline-debug "out" dump, on_progress callback, node SSE event.
+    """
+
+    def decorate(fn: _NodeFn) -> _NodeFn:
+        @functools.wraps(fn)
+        async def wrapper(self: ResearchGraph, state: ResearchState, *args: Any, **kwargs: Any) -> ResearchState:
+            self._write_stage_in(node, state)
+            self._emit_node_start(node, state)
+            logger.info(
+                "node_stage_start",
+                node=node,
+                phase=_PHASE_VALUE[state.current_phase],
+                iteration=state.iteration,
+                entity_count=len(state.entities),
+                risk_flags=len(state.risk_flags),
+            )
+            state = await fn(self, state, *args, **kwargs)
+            self._write_stage_out(node, state)
+            self._notify_progress(node, state)
+            self._emit_progress(
+                {"event": "node", "node": node, "phase": state.current_phase, "iteration": state.iteration}
+            )
+            return state
+
+        return wrapper
+
+    return decorate
 
 
 class ResearchGraph:
@@ -60,18 +176,38 @@ class ResearchGraph:
         debug: bool = False,
         output_dir: str = "outputs",
         on_progress: Callable[[str, dict], None] | None = None,
+        pretty_debug: bool = False,
     ) -> None:
-        settings = get_settings()
+        # One settings snapshot per graph: nodes read flags from it, and a run never sees settings change mid-way
+        settings = self._settings = get_settings()
+        self._enable_graph_db = settings.agent.enable_graph_db
+        self._tracing_enabled = settings.observability.tracing_enabled
+        self._max_concurrent_agents = max(1, settings.agent.max_concurrent_agents)
         budget = budget_usd if budget_usd is not None else settings.agent.cost_budget_usd
         self._debug = debug
+        # Debug dumps are written compact unless asked for; indenting a large state costs more than encoding it
+        self._pretty_debug = pretty_debug
         self._output_dir = output_dir
         self._on_progress = on_progress
         self._progress_path: Path | None = None  # Set at start of investigate() when subject known
+        self._progress_fp: BinaryIO | None = None  # Held open for the duration of investigate()
+        self._progress_flusher: asyncio.Task[None] | None = None
         self._pipeline_debug_dir: Path | None = Path(output_dir) / "pipeline_debug" if debug else None
+        if self._pipeline_debug_dir is not None:
+            self._pipeline_debug_dir.mkdir(parents=True, exist_ok=True)
+        # Per-subject iteration snapshot dir; created on the first debug snapshot, reset per investigation
+        self._snapshot_dir: Path | None = None
+        # Previous iteration's dump; later snapshots only carry changes
+        self._last_snapshot: dict[str, Any] | None = None
         self._pipeline_step = 0
+        self._stage_in_cache: dict[str, tuple[int, dict[str, Any]]] = {}
+        # Debug dumps are multi-MB for large states; one writer thread keeps the disk I/O off the event loop
+        self._debug_writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="debug-dump") if debug else None
+        self._pending_debug_writes: list[asyncio.Future[Any]] = []
         self.llm_client = LLMClient(budget_usd=budget)
         self.search = SearchOrchestrator()
         self.neo4j = Neo4jClient()
+        self._neo4j_connect: asyncio.Task[None] | None = None  # In-flight background connect, see _warm_neo4j()
 
         self.director = ResearchDirector(self.llm_client)
         self.web_researcher = WebResearchAgent(self.search)
@@ -82,21 +218,31 @@ class ResearchGraph:
         self.report_generator = ReportGenerator(self.llm_client)
         self.temporal_analyzer = TemporalAnalyzer(self.llm_client)
         self.entity_resolver = EntityResolver(self.llm_client)
-        self._checkpointer = MemorySaver()
+        self._checkpointer = BoundedMemorySaver(
+            max_threads=settings.agent.max_checkpoint_threads, serde=_checkpoint_serializer()
+        )
 
         self.graph = self._build_graph()
 
     def _build_graph(self) -> Any:
-        """Construct the LangGraph state machine. State is dict (ResearchState.model_dump())."""
-        graph = StateGraph(dict)
+        """Construct the LangGraph state machine.
 
-        graph.add_node("director", self._director_node)
-        graph.add_node("web_research", self._web_research_node)
-        graph.add_node("fact_extraction", self._fact_extraction_node)
-        graph.add_node("risk_analysis", self._risk_analysis_node)
-        graph.add_node("connection_mapping", self._connection_mapping_node)
-        graph.add_node("source_verification", self._source_verification_node)
-        graph.add_node("synthesis", self._synthesis_node)
+        An untyped schema gives a single root channel, so the ResearchState object itself is carried between
+        nodes instead of being validated from / dumped to a dict at every node boundary.
+        """
+        # StateGraph's type vars want a TypedDict/pydantic schema; the untyped root channel is intentional
+        graph = StateGraph(object)  # type: ignore[type-var]
+
+        # input_schema=object stops LangGraph from re-validating the ResearchState from the node type hints
+        untyped: Any = object
+        graph.add_node("director", self._director_node, input_schema=untyped)
+        graph.add_node("web_research", self._web_research_node, input_schema=untyped)
+        graph.add_node("fact_extraction", self._fact_extraction_node, input_schema=untyped)
+        graph.add_node("risk_analysis", self._risk_analysis_node, input_schema=untyped)
+        graph.add_node("connection_mapping", self._connection_mapping_node, input_schema=untyped)
+        graph.add_node("source_verification", self._source_verification_node, input_schema=untyped)
+        graph.add_node("analysis", self._analysis_node, input_schema=untyped)
+        graph.add_node("synthesis", self._synthesis_node, input_schema=untyped)
 
         graph.set_entry_point("director")
         graph.add_conditional_edges(
@@ -107,6 +253,7 @@ class ResearchGraph:
                 "risk_analysis": "risk_analysis",
                 "connection_mapping": "connection_mapping",
                 "source_verification": "source_verification",
+                "analysis": "analysis",
                 "generate_report": "synthesis",
                 "end": END,
             },
@@ -117,24 +264,48 @@ class ResearchGraph:
         graph.add_edge("risk_analysis", "director")
         graph.add_edge("connection_mapping", "director")
         graph.add_edge("source_verification", "director")
+        graph.add_edge("analysis", "director")
 
         return graph.compile(checkpointer=self._checkpointer)
 
-    def _write_stage_in(self, node_name: str, state_in: dict) -> None:
+    def _write_stage_in(self, node_name: str, state: ResearchState) -> None:
+        """Dump the node's input now and hold it until _write_stage_out writes the in/out pair as one file."""
         if not self._pipeline_debug_dir:
             return
         self._pipeline_step += 1
-        self._pipeline_debug_dir.mkdir(parents=True, exist_ok=True)
-        (self._pipeline_debug_dir / f"step_{self._pipeline_step:03d}_{node_name}_in.json").write_text(
-            json.dumps(state_in, indent=2, default=str), encoding="utf-8"
-        )
+        # Keyed by node: analysis/synthesis run sub-nodes concurrently, so each keeps its own step number
+        self._stage_in_cache[node_name] = (self._pipeline_step, state.model_dump())
 
-    def _write_stage_out(self, node_name: str, state_out: dict) -> None:
+    def _write_stage_out(self, node_name: str, state: ResearchState, dumped: dict[str, Any] | None = None) -> None:
         if not self._pipeline_debug_dir:
             return
-        (self._pipeline_debug_dir / f"step_{self._pipeline_step:03d}_{node_name}_out.json").write_text(
-            json.dumps(state_out, indent=2, default=str), encoding="utf-8"
-        )
+        step, state_in = self._stage_in_cache.pop(node_name, (self._pipeline_step, None))
+        path = self._pipeline_debug_dir / f"step_{step:03d}_{node_name}.json"
+        state_out = dumped if dumped is not None else state.model_dump()
+        self._write_debug_json(path, {"step": step, "node": node_name, "in": state_in, "out": state_out})
+
+    def _write_debug_json(self, path: Path, data: Any) -> None:
+        """Encode now (the state keeps changing) and hand the file write to the debug writer thread."""
+        payload = _encode_json(data, pretty=self._pretty_debug)
+        write = asyncio.get_running_loop().run_in_executor(self._debug_writer, path.write_bytes, payload)
+        self._pending_debug_writes.append(write)
+
+    async def _flush_debug_writes(self) -> None:
+        """Wait for queued debug dumps; a failed write is logged, never fails the investigation."""
+        pending, self._pending_debug_writes = self._pending_debug_writes, []
+        for result in await asyncio.gather(*pending, return_exceptions=True):
+            if isinstance(result, Exception):
+                logger.warning("debug_dump_write_error", error=str(result))
+
+    def _notify_progress(self, node_name: str, state: ResearchState, snapshot: dict[str, Any] | None = None) -> None:
+        """Hand the state to the on_progress callback as a dict.
+
+        By default this is a shallow field view (O(fields), not a full model_dump) whose values are the live
+        state objects, so callbacks must read it synchronously. Pass ``snapshot`` when the caller already
+        dumped the current state.
+        """
+        if self._on_progress:
+            self._on_progress(node_name, snapshot if snapshot is not None else dict(state))
 
     # Approximate total node steps per iteration cycle for progress calculation
     _NODES_PER_CYCLE = 7
@@ -151,34 +322,72 @@ class ResearchGraph:
         "generate_report": "Report Generation",
         "update_graph_db": "Graph DB Sync",
         "graph_reasoning": "Graph Reasoning",
+        "analysis": "Triangulation Analysis",
         "synthesis": "Synthesis",
     }
 
+    # SSE readers tail the progress file; events are buffered and flushed at most this long after they're emitted
+    _PROGRESS_FLUSH_INTERVAL_S = 0.1
+
+    def _open_progress(self, path: Path) -> None:
+        """Open the progress file once per investigation; every event is appended through this descriptor."""
+        self._progress_path = path
+        try:
+            # Buffered: bursts of events (e.g. one per search query) coalesce into one write() per flush
+            self._progress_fp = open(path, "ab", buffering=65536)  # noqa: SIM115 — closed in _close_progress
+        except OSError as e:
+            logger.debug("progress_file_open_error", path=str(path), error=str(e))
+            return
+        self._progress_flusher = asyncio.get_running_loop().create_task(self._flush_progress_periodically())
+
+    async def _flush_progress_periodically(self) -> None:
+        while self._progress_fp is not None:
+            await asyncio.sleep(self._PROGRESS_FLUSH_INTERVAL_S)
+            if self._progress_fp is None:
+                return
+            try:
+                self._progress_fp.flush()
+            except OSError as e:
+                logger.debug("progress_file_write_error", path=str(self._progress_path), error=str(e))
+
+    def _close_progress(self) -> None:
+        if self._progress_flusher is not None:
+            self._progress_flusher.cancel()
+            self._progress_flusher = None
+        if self._progress_fp is not None:
+            try:
+                self._progress_fp.close()  # flushes whatever the flusher hasn't written yet
+            except OSError as e:
+                logger.debug("progress_file_write_error", path=str(self._progress_path), error=str(e))
+            self._progress_fp = None
+
     def _emit_progress(self, event: dict) -> None:
-        """Append one progress event (JSON line) to the progress file for SSE streaming."""
-        if not self._progress_path:
+        """Append one progress event (JSON line) to the progress file for SSE streaming.
+
+        The event dict is stamped in place; callers pass a fresh literal and never reuse it.
+        """
+        if self._progress_fp is None:
             return
         try:
-            payload = {**event, "ts": datetime.now(timezone.utc).isoformat()}
-            with open(self._progress_path, "a", encoding="utf-8") as f:
-                f.write(json.dumps(payload, default=str) + "\n")
+            # orjson formats the aware datetime natively (same ISO-8601 text as isoformat(), done in C)
+            event["ts"] = datetime.now(timezone.utc)
+            self._progress_fp.write(orjson.dumps(event, default=str, option=orjson.OPT_APPEND_NEWLINE))
         except OSError as e:
             logger.debug("progress_file_write_error", path=str(self._progress_path), error=str(e))
 
-    def _emit_node_start(self, node: str, state_dict: dict) -> None:
+    def _emit_node_start(self, node: str, state: ResearchState) -> None:
         """Emit a node_start SSE event before a node executes."""
-        iteration = state_dict.get("iteration", 0)
-        max_iter = state_dict.get("max_iterations", 1) or 1
-        phase = state_dict.get("current_phase", "")
-        if isinstance(phase, dict):
-            phase = phase.get("value", "")
+        if self._progress_fp is None:
+            return
+        iteration = state.iteration
+        max_iter = state.max_iterations or 1
         # Approximate progress: cap at 0.95 so complete event drives to 1.0
         progress = min((iteration * self._NODES_PER_CYCLE) / (max_iter * self._NODES_PER_CYCLE + 1), 0.95)
         self._emit_progress({
             "event": "node_start",
             "node": node,
-            "label": self._NODE_LABELS.get(node, node.replace("_", " ").title()),
-            "phase": phase,
+            "label": self._NODE_LABELS.get(node) or node.replace("_", " ").title(),
+            "phase": _PHASE_VALUE[state.current_phase],
             "iteration": iteration,
             "progress": round(progress, 3),
         })
@@ -188,16 +397,15 @@ class ResearchGraph:
         state.logs.append(message)
         self._emit_progress({"event": "log", "node": "unknown", "message": message})
 
-    async def _director_node(self, state_dict: dict) -> dict:
-        state = ResearchState(**state_dict)
+    async def _director_node(self, state: ResearchState) -> ResearchState:
+        self._write_stage_in("director", state)
         state.iteration += 1
         prev_phase = state.current_phase
-        self._write_stage_in("director", state_dict)
-        self._emit_node_start("director", {**state_dict, "iteration": state.iteration})
+        self._emit_node_start("director", state)
         logger.info(
             "node_stage_start",
             node="director",
-            phase=state.current_phase.value,
+            phase=_PHASE_VALUE[state.current_phase],
             iteration=state.iteration,
             entity_count=len(state.entities),
             risk_flags=len(state.risk_flags),
@@ -205,7 +413,7 @@ class ResearchGraph:
         logger.info(
             "director_iteration",
             iteration=state.iteration,
-            phase=state.current_phase.value,
+            phase=_PHASE_VALUE[state.current_phase],
             entities=len(state.entities),
         )
         decision = await self.director.plan_next_step(state)
@@ -216,58 +424,70 @@ class ResearchGraph:
         if new_phase != prev_phase:
             logger.info(
                 "phase_transition",
-                from_phase=prev_phase.value,
-                to_phase=new_phase.value,
-                phase=new_phase.value,
+                from_phase=_PHASE_VALUE[prev_phase],
+                to_phase=_PHASE_VALUE[new_phase],
+                phase=_PHASE_VALUE[new_phase],
                 iteration=state.iteration,
             )
         # Track phases executed for run metadata
         phase = decision.current_phase
-        phase_val = phase.value if hasattr(phase, "value") else str(phase)
-        if not hasattr(state, "_phases_executed"):
-            state._phases_executed = []  # type: ignore[attr-defined]
-        if phase_val not in getattr(state, "_phases_executed", []):
-            state._phases_executed.append(phase_val)  # type: ignore[attr-defined]
+        phase_val = _PHASE_VALUE.get(phase) or str(phase)
+        # Insertion-ordered dict as an ordered set: O(1) dedup, first-seen phase order kept for run metadata
+        phases_executed = getattr(state, "_phases_executed", None)
+        if phases_executed is None:
+            phases_executed = state._phases_executed = {}  # type: ignore[attr-defined]
+        phases_executed.setdefault(phase_val, None)
         if decision.next_action == AgentAction.TERMINATE:
             state.should_terminate = True
+        self._emit_log(
+            state,
+            f"Director planned: {_ACTION_VALUE[decision.next_action]} "
+            f"(phase: {_PHASE_VALUE[state.current_phase]}, iter {state.iteration})",
+        )
+        # State is final from here on: one model_dump() feeds the iteration snapshot, on_progress, and the
+        # pipeline-debug out record
+        snapshot = None
         if self._debug:
-            slug = state.subject.full_name.replace(" ", "_").lower()
-            snapshot_dir = Path(self._output_dir) / slug
-            snapshot_dir.mkdir(parents=True, exist_ok=True)
-            snapshot_path = snapshot_dir / f"iteration_{state.iteration}.json"
-            snapshot_path.write_text(
-                json.dumps(state.model_dump(), indent=2, default=str),
-                encoding="utf-8",
-            )
+            if self._snapshot_dir is None:
+                self._snapshot_dir = Path(self._output_dir) / state.subject.full_name.replace(" ", "_").lower()
+                self._snapshot_dir.mkdir(parents=True, exist_ok=True)
+            snapshot_path = self._snapshot_dir / f"iteration_{state.iteration}.json"
+            snapshot = state.model_dump()
+            self._write_debug_json(snapshot_path, self._snapshot_delta(snapshot))
+            self._last_snapshot = snapshot
             logger.debug("debug_snapshot_written", path=str(snapshot_path))
-        out = state.model_dump()
-        if self._on_progress:
-            self._on_progress("director", out)
-        phase_str = out.get("current_phase", "")
-        if isinstance(phase_str, dict):
-            phase_str = phase_str.get("value", "")
-        self._emit_log(state, f"Director planned: {decision.next_action.value} (phase: {phase_str}, iter {state.iteration})")
+        self._notify_progress("director", state, snapshot)
         self._emit_progress(
-            {"event": "node", "node": "director", "phase": out.get("current_phase"), "iteration": out.get("iteration")}
+            {"event": "node", "node": "director", "phase": state.current_phase, "iteration": state.iteration}
         )
-        self._write_stage_out("director", out)
-        return out
+        self._write_stage_out("director", state, snapshot)
+        return state
 
-    async def _web_research_node(self, state_dict: dict) -> dict:
-        self._write_stage_in("web_research", state_dict)
-        self._emit_node_start("web_research", state_dict)
-        state = ResearchState(**state_dict)
-        logger.info(
-            "node_stage_start",
-            node="web_research",
-            phase=state.current_phase.value,
-            iteration=state.iteration,
-            entity_count=len(state.entities),
-        )
+    def _snapshot_delta(self, snapshot: dict[str, Any]) -> dict[str, Any]:
+        """Iteration snapshot to write: the full state first, then only the top-level fields that changed.
+
+        Unchanged fields are listed under "unchanged_fields" (their values are in an earlier iteration file),
+        so an iteration that only adds a log line doesn't re-encode every entity and connection.
+        """
+        prev = self._last_snapshot
+        if prev is None:
+            return snapshot
+        delta: dict[str, Any] = {}
+        unchanged: list[str] = []
+        for key, value in snapshot.items():
+            if key != "iteration" and prev.get(key) == value:
+                unchanged.append(key)
+            else:
+                delta[key] = value
+        delta["unchanged_fields"] = unchanged
+        return delta
+
+    @_instrumented("web_research")
+    async def _web_research_node(self, state: ResearchState) -> ResearchState:
         queries = state.last_decision.search_queries if state.last_decision else []
         if not queries:
             logger.warning("web_research_no_queries")
-            return state.model_dump()
+            return state
         def on_search(q: str, ph: str) -> None:
             self._emit_progress({"event": "search", "query": q, "phase": ph})
             self._emit_log(state, f"Searching ({ph}): {q}")
@@ -275,183 +495,141 @@ class ResearchGraph:
         state = await self.web_researcher.execute_searches(
             state=state, queries=queries, phase=state.current_phase, on_search=on_search
         )
-        out = state.model_dump()
-        self._write_stage_out("web_research", out)
-        if self._on_progress:
-            self._on_progress("web_research", out)
         self._emit_log(state, f"Web research complete — {len(queries)} queries, iter {state.iteration}")
-        self._emit_progress(
-            {"event": "node", "node": "web_research", "phase": out.get("current_phase"), "iteration": out.get("iteration")}
-        )
-        return out
+        return state
 
-    async def _fact_extraction_node(self, state_dict: dict) -> dict:
-        self._write_stage_in("fact_extraction", state_dict)
-        self._emit_node_start("fact_extraction", state_dict)
-        state = ResearchState(**state_dict)
-        logger.info(
-            "node_stage_start",
-            node="fact_extraction",
-            phase=state.current_phase.value,
-            iteration=state.iteration,
-            entity_count=len(state.entities),
-        )
+    @_instrumented("fact_extraction")
+    async def _fact_extraction_node(self, state: ResearchState) -> ResearchState:
         state = await self.fact_extractor.extract_facts(state)
-        out = state.model_dump()
-        self._write_stage_out("fact_extraction", out)
-        if self._on_progress:
-            self._on_progress("fact_extraction", out)
-        entity_count = len(out.get("entities") or [])
+        entity_count = len(state.entities)
         self._emit_progress({"event": "entities_update", "count": entity_count})
         self._emit_log(state, f"Extracted facts — {entity_count} entities so far (iter {state.iteration})")
-        self._emit_progress(
-            {"event": "node", "node": "fact_extraction", "phase": out.get("current_phase"), "iteration": out.get("iteration")}
-        )
-        return out
+        return state
 
-    async def _risk_analysis_node(self, state_dict: dict) -> dict:
-        self._write_stage_in("risk_analysis", state_dict)
-        self._emit_node_start("risk_analysis", state_dict)
-        state = ResearchState(**state_dict)
-        logger.info(
-            "node_stage_start",
-            node="risk_analysis",
-            phase=state.current_phase.value,
-            iteration=state.iteration,
-            entity_count=len(state.entities),
-            risk_flags=len(state.risk_flags),
-        )
+    @_instrumented("risk_analysis")
+    async def _risk_analysis_node(self, state: ResearchState) -> ResearchState:
         state = await self.risk_analyzer.analyze_risks(state)
-        out = state.model_dump()
-        self._write_stage_out("risk_analysis", out)
-        if self._on_progress:
-            self._on_progress("risk_analysis", out)
-        risk_count = len(out.get("risk_flags") or [])
+        risk_count = len(state.risk_flags)
         self._emit_progress({"event": "risks_update", "count": risk_count})
         self._emit_log(state, f"Risk analysis complete — {risk_count} flags (iter {state.iteration})")
-        self._emit_progress(
-            {"event": "node", "node": "risk_analysis", "phase": out.get("current_phase"), "iteration": out.get("iteration")}
-        )
-        return out
+        return state
 
-    async def _connection_mapping_node(self, state_dict: dict) -> dict:
-        self._write_stage_in("connection_mapping", state_dict)
-        self._emit_node_start("connection_mapping", state_dict)
-        state = ResearchState(**state_dict)
-        logger.info(
-            "node_stage_start",
-            node="connection_mapping",
-            phase=state.current_phase.value,
-            iteration=state.iteration,
-            entity_count=len(state.entities),
-        )
+    @_instrumented("connection_mapping")
+    async def _connection_mapping_node(self, state: ResearchState) -> ResearchState:
         state = await self.connection_mapper.map_connections(state)
-        out = state.model_dump()
-        self._write_stage_out("connection_mapping", out)
-        if self._on_progress:
-            self._on_progress("connection_mapping", out)
-        conn_count = len(out.get("connections") or [])
+        conn_count = len(state.connections)
         self._emit_log(state, f"Mapped {conn_count} connections (iter {state.iteration})")
-        self._emit_progress(
-            {"event": "node", "node": "connection_mapping", "phase": out.get("current_phase"), "iteration": out.get("iteration")}
-        )
-        return out
+        return state
 
-    async def _source_verification_node(self, state_dict: dict) -> dict:
-        self._write_stage_in("source_verification", state_dict)
-        self._emit_node_start("source_verification", state_dict)
-        state = ResearchState(**state_dict)
-        logger.info(
-            "node_stage_start",
-            node="source_verification",
-            phase=state.current_phase.value,
-            iteration=state.iteration,
-            entity_count=len(state.entities),
-        )
+    @_instrumented("source_verification")
+    async def _source_verification_node(self, state: ResearchState) -> ResearchState:
         state = await self.source_verifier.verify_sources(state)
-        out = state.model_dump()
-        self._write_stage_out("source_verification", out)
-        if self._on_progress:
-            self._on_progress("source_verification", out)
         self._emit_log(state, f"Sources verified (iter {state.iteration})")
-        self._emit_progress(
-            {"event": "node", "node": "source_verification", "phase": out.get("current_phase"), "iteration": out.get("iteration")}
-        )
-        return out
+        return state
 
-    async def _synthesis_node(self, state_dict: dict) -> dict:
-        """
-        Run the full synthesis pipeline with a single Neo4j driver lifecycle.
-        Driver is owned here: open once, pass to nodes that need it, close in one finally.
+    # Analysis workers write disjoint state fields (risk flags / connections, hypotheses / confidence scores),
+    # so they can run concurrently on the same state object
+    async def _analysis_node(self, state: ResearchState) -> ResearchState:
+        """Run risk analysis, connection mapping, and source verification concurrently.
+
+        Reached only on ANALYZE_ALL; single analysis actions route to their own node.
+        At most ``agent.max_concurrent_agents`` workers run at once.
         """
-        settings = get_settings()
-        neo4j_client: Neo4jClient | None = None
-        if settings.agent.enable_graph_db:
-            neo4j_client = Neo4jClient()
-            await neo4j_client.connect()
-        try:
-            self._emit_node_start("synthesis", state_dict)
-            self._emit_node_start("entity_resolution", state_dict)
-            state_dict = await self._entity_resolution_node(state_dict)
-            self._emit_node_start("temporal_analysis", state_dict)
-            state_dict = await self._temporal_analysis_node(state_dict)
-            self._emit_node_start("update_graph_db", state_dict)
-            state_dict = await self._update_graph_db_node(state_dict, neo4j=neo4j_client)
-            self._emit_node_start("graph_reasoning", state_dict)
-            state_dict = await self._graph_reasoning_node(state_dict, neo4j=neo4j_client)
-            self._emit_node_start("generate_report", state_dict)
-            state_dict = await self._generate_report_node(state_dict)
-            return state_dict
-        finally:
-            if neo4j_client is not None and neo4j_client.is_connected:
-                await neo4j_client.close()
+        self._emit_node_start("analysis", state)
+        limit = asyncio.Semaphore(self._max_concurrent_agents)
+
+        async def bounded(worker: Awaitable[ResearchState]) -> ResearchState:
+            async with limit:
+                return await worker
 
-    async def _graph_reasoning_node(self, state_dict: dict, neo4j: Neo4jClient | None = None) -> dict:
+        await asyncio.gather(
+            bounded(self._risk_analysis_node(state)),
+            bounded(self._connection_mapping_node(state)),
+            bounded(self._source_verification_node(state)),
+        )
+        return state
+
+    def _warm_neo4j(self) -> None:
+        """Start connecting the shared Neo4j client in the background, so the handshake overlaps research."""
+        if self._enable_graph_db and self._neo4j_connect is None and not self.neo4j.is_connected:
+            self._neo4j_connect = asyncio.get_running_loop().create_task(self.neo4j.connect())
+
+    async def _ensure_neo4j(self) -> Neo4jClient | None:
+        """Return the shared Neo4j client once connected; its driver pool lives until cleanup()."""
+        if not self._enable_graph_db:
+            return None
+        self._warm_neo4j()
+        await self._await_neo4j_connect()
+        return self.neo4j
+
+    async def _await_neo4j_connect(self) -> None:
+        # connect() logs and leaves the client disconnected on failure; the next _ensure_neo4j() retries
+        if self._neo4j_connect is not None:
+            await self._neo4j_connect
+            self._neo4j_connect = None
+
+    async def _synthesis_node(self, state: ResearchState) -> ResearchState:
+        """
+        Run the full synthesis pipeline on the graph's pooled Neo4j driver.
+        Nodes that need Neo4j borrow it and leave it open; cleanup() closes it.
+        """
+        neo4j_client = await self._ensure_neo4j()
+        self._emit_node_start("synthesis", state)
+        # Temporal analysis runs after resolution: its facts reference entity ids, which merges rewrite
+        state = await self._entity_resolution_node(state)
+        state = await self._temporal_analysis_node(state)
+        state = await self._update_graph_db_node(state, neo4j=neo4j_client)
+        state = await self._graph_reasoning_node(state, neo4j=neo4j_client)
+        return await self._generate_report_node(state)
+
+    @_instrumented("graph_reasoning")
+    async def _graph_reasoning_node(self, state: ResearchState, neo4j: Neo4jClient | None = None) -> ResearchState:
         """Run graph discovery queries. Does not own the driver; caller closes."""
         client = neo4j if neo4j is not None else self.neo4j
-        self._write_stage_in("graph_reasoning", state_dict)
-        self._emit_node_start("graph_reasoning", state_dict)
-        out = await run_graph_reasoning(state_dict, client)
-        self._write_stage_out("graph_reasoning", out)
-        if self._on_progress:
-            self._on_progress("graph_reasoning", out)
-        self._emit_progress(
-            {"event": "node", "node": "graph_reasoning", "phase": out.get("current_phase"), "iteration": out.get("iteration")}
-        )
-        return out
+        # graph_reasoner works on a dict view; only graph_insights comes back
+        view = {
+            "subject": state.subject,
+            "graph_db_populated": state.graph_db_populated,
+            "graph_insights": state.graph_insights,
+        }
+        state.graph_insights = (await run_graph_reasoning(view, client))["graph_insights"]
+        return state
 
-    async def _update_graph_db_node(self, state_dict: dict, neo4j: Neo4jClient | None = None) -> dict:
-        """Persist state to Neo4j and run inline discovery. Does not close when neo4j is passed (caller owns it)."""
-        client = neo4j if neo4j is not None else self.neo4j
-        owned_by_caller = neo4j is not None
-        self._write_stage_in("update_graph_db", state_dict)
-        self._emit_node_start("update_graph_db", state_dict)
-        state = ResearchState(**state_dict)
-        settings = get_settings()
+    @_instrumented("update_graph_db")
+    async def _update_graph_db_node(self, state: ResearchState, neo4j: Neo4jClient | None = None) -> ResearchState:
+        """Persist state to Neo4j and run inline discovery. Never closes the client; cleanup() does."""
+        client = neo4j if neo4j is not None else await self._ensure_neo4j()
         graph_db_populated = False
-        if settings.agent.enable_graph_db and client is not None:
+        if self._enable_graph_db and client is not None:
             try:
-                if not client.is_connected:
-                    await client.connect()
                 await client.clear_graph()
-                counts = await client.persist_state(state)
+                counts = await client.persist_state(state, fresh_graph=True)
                 logger.info("graph_db_updated", **counts)
                 graph_db_populated = (counts.get("nodes", 0) or counts.get("relationships", 0)) > 0
-                try:
-                    centrality = await client.degree_centrality(top_n=10)
-                    if centrality:
-                        state.graph_insights.append({"type": "degree_centrality", "data": centrality})
-                    risk_entity_names = set()
-                    for flag in state.risk_flags:
-                        for eid in flag.entity_ids:
-                            entity = state.get_entity_by_id(eid)
-                            if entity:
-                                risk_entity_names.add(entity.name)
-                    subject_name = (state.subject.full_name or "").strip()
-                    for name in list(risk_entity_names)[:5]:
-                        if not name or name == subject_name:
-                            continue
-                        paths = await client.shortest_path(subject_name, name)
+                # One id -> name index instead of a linear get_entity_by_id scan per flagged id
+                name_by_id = {e.id: e.name for e in state.entities}
+                risk_entity_names = {
+                    name_by_id[eid] for flag in state.risk_flags for eid in flag.entity_ids if eid in name_by_id
+                }
+                subject_name = (state.subject.full_name or "").strip()
+                targets = [n for n in list(risk_entity_names)[:5] if n and n != subject_name]
+                # Independent read-only queries: each borrows its own session from the driver pool
+                results = await asyncio.gather(
+                    client.degree_centrality(top_n=10),
+                    client.shortest_paths(subject_name, targets),
+                    client.detect_shell_companies(),
+                    return_exceptions=True,
+                )
+                for result in results:
+                    if isinstance(result, Exception):
+                        logger.warning("graph_discovery_error", error=str(result))
+                # A failed query only drops its own insight
+                centrality, paths_by_name, shells = (None if isinstance(r, Exception) else r for r in results)
+                if centrality:
+                    state.graph_insights.append({"type": "degree_centrality", "data": centrality})
+                if paths_by_name:
+                    for name in targets:
+                        paths = paths_by_name.get(name.strip())
                         if paths:
                             state.graph_insights.append({
                                 "type": "shortest_path",
@@ -459,134 +637,68 @@ class ResearchGraph:
                                 "to": name,
                                 "data": paths,
                             })
-                    shells = await client.detect_shell_companies()
-                    if shells:
-                        state.graph_insights.append({"type": "shell_companies", "data": shells})
-                except Exception as e:
-                    logger.warning("graph_discovery_error", error=str(e))
+                if shells:
+                    state.graph_insights.append({"type": "shell_companies", "data": shells})
             except Exception as e:
                 logger.error("graph_db_error", error=str(e))
                 state.error_log.append(f"Neo4j: {e}")
-            finally:
-                if not owned_by_caller and client.is_connected:
-                    await client.close()
         state.graph_db_populated = graph_db_populated
-        out = state.model_dump()
-        self._write_stage_out("update_graph_db", out)
-        if self._on_progress:
-            self._on_progress("update_graph_db", out)
-        self._emit_progress(
-            {"event": "node", "node": "update_graph_db", "phase": out.get("current_phase"), "iteration": out.get("iteration")}
-        )
-        return out
+        return state
 
-    async def _entity_resolution_node(self, state_dict: dict) -> dict:
-        self._write_stage_in("entity_resolution", state_dict)
-        self._emit_node_start("entity_resolution", state_dict)
-        state = ResearchState(**state_dict)
-        logger.info(
-            "node_stage_start",
-            node="entity_resolution",
-            phase=state.current_phase.value,
-            iteration=state.iteration,
-            entity_count=len(state.entities),
-        )
+    @_instrumented("entity_resolution")
+    async def _entity_resolution_node(self, state: ResearchState) -> ResearchState:
         # Only run entity resolution when entity count > 15
         if len(state.entities) > 15:
             state = await self.entity_resolver.resolve(state)
         else:
             logger.info("entity_resolution_skipped", reason="entity_count_below_threshold", count=len(state.entities))
-        out = state.model_dump()
-        self._write_stage_out("entity_resolution", out)
-        if self._on_progress:
-            self._on_progress("entity_resolution", out)
-        entity_count = len(out.get("entities") or [])
+        entity_count = len(state.entities)
         self._emit_progress({"event": "entities_update", "count": entity_count})
         self._emit_log(state, f"Entity resolution done — {entity_count} entities")
-        self._emit_progress(
-            {
-                "event": "node", "node": "entity_resolution",
-                "phase": out.get("current_phase"), "iteration": out.get("iteration"),
-            }
-        )
-        return out
+        return state
 
-    async def _temporal_analysis_node(self, state_dict: dict) -> dict:
-        self._write_stage_in("temporal_analysis", state_dict)
-        self._emit_node_start("temporal_analysis", state_dict)
-        state = ResearchState(**state_dict)
-        logger.info(
-            "node_stage_start",
-            node="temporal_analysis",
-            phase=state.current_phase.value,
-            iteration=state.iteration,
-            entity_count=len(state.entities),
-        )
+    @_instrumented("temporal_analysis")
+    async def _temporal_analysis_node(self, state: ResearchState) -> ResearchState:
         state = await self.temporal_analyzer.analyze_timeline(state)
-        out = state.model_dump()
-        self._write_stage_out("temporal_analysis", out)
-        if self._on_progress:
-            self._on_progress("temporal_analysis", out)
-        facts_count = len(out.get("temporal_facts") or [])
+        facts_count = len(state.temporal_facts)
         self._emit_log(state, f"Temporal analysis complete — {facts_count} facts")
-        self._emit_progress(
-            {
-                "event": "node", "node": "temporal_analysis",
-                "phase": out.get("current_phase"), "iteration": out.get("iteration"),
-            }
-        )
-        return out
+        return state
 
-    async def _generate_report_node(self, state_dict: dict) -> dict:
-        self._write_stage_in("generate_report", state_dict)
-        self._emit_node_start("generate_report", state_dict)
-        state = ResearchState(**state_dict)
-        logger.info(
-            "node_stage_start",
-            node="generate_report",
-            phase=state.current_phase.value,
-            iteration=state.iteration,
-            entity_count=len(state.entities),
-            risk_flags=len(state.risk_flags),
-        )
+    @_instrumented("generate_report")
+    async def _generate_report_node(self, state: ResearchState) -> ResearchState:
         self._emit_log(state, "Generating final report…")
         state = await self.report_generator.generate_report(state)
-        out = state.model_dump()
-        self._write_stage_out("generate_report", out)
-        if self._on_progress:
-            self._on_progress("generate_report", out)
         self._emit_log(state, "Report generated successfully")
         self._emit_progress({
             "event": "complete",
-            "subject": out.get("subject", {}).get("full_name", "") if isinstance(out.get("subject"), dict) else "",
-            "iterations": out.get("iteration", 0),
-            "entities": len(out.get("entities") or []),
-            "risk_flags": len(out.get("risk_flags") or []),
-            "cost_usd": out.get("estimated_cost_usd", 0.0),
+            "subject": state.subject.full_name,
+            "iterations": state.iteration,
+            "entities": len(state.entities),
+            "risk_flags": len(state.risk_flags),
+            "cost_usd": state.estimated_cost_usd,
             "progress": 1.0,
         })
-        self._emit_progress(
-            {"event": "node", "node": "generate_report", "phase": out.get("current_phase"), "iteration": out.get("iteration")}
-        )
-        return out
+        return state
+
+    _ROUTE_MAP: dict[AgentAction, str] = {
+        AgentAction.SEARCH_WEB: "web_research",
+        AgentAction.EXTRACT_FACTS: "web_research",
+        AgentAction.ANALYZE_RISKS: "risk_analysis",
+        AgentAction.MAP_CONNECTIONS: "connection_mapping",
+        AgentAction.VERIFY_SOURCES: "source_verification",
+        AgentAction.ANALYZE_ALL: "analysis",
+        AgentAction.UPDATE_GRAPH: "web_research",
+        AgentAction.GENERATE_REPORT: "generate_report",
+        AgentAction.TERMINATE: "generate_report",
+    }
 
-    def _route_from_director(self, state_dict: dict) -> str:
-        state = ResearchState(**state_dict)
-        if not state.last_decision:
+    def _route_from_director(self, state: ResearchState) -> str:
+        decision = state.last_decision
+        if not decision:
             return "web_research"
-        action = state.last_decision.next_action
-        route_map = {
-            AgentAction.SEARCH_WEB: "web_research",
-            AgentAction.EXTRACT_FACTS: "web_research",
-            AgentAction.ANALYZE_RISKS: "risk_analysis",
-            AgentAction.MAP_CONNECTIONS: "connection_mapping",
-            AgentAction.VERIFY_SOURCES: "source_verification",
-            AgentAction.UPDATE_GRAPH: "web_research",
-            AgentAction.GENERATE_REPORT: "generate_report",
-            AgentAction.TERMINATE: "generate_report",
-        }
-        route = route_map.get(action, "web_research")
-        logger.info("routing_decision", action=action.value, route=route)
+        action = decision.next_action
+        route = self._ROUTE_MAP.get(action, "web_research")
+        logger.info("routing_decision", action=_ACTION_VALUE[action], route=route)
         return route
 
     async def investigate(
@@ -597,12 +709,14 @@ class ResearchGraph:
         max_iterations: int | None = None,
     ) -> ResearchState:
         """Run a full investigation; returns final ResearchState."""
-        settings = get_settings()
-        max_iter = max_iterations or settings.agent.max_search_iterations
+        max_iter = max_iterations or self._settings.agent.max_search_iterations
 
         slug = _subject_slug(subject_name)
+        self._snapshot_dir = None
+        self._last_snapshot = None
         if slug:
-            self._progress_path = Path(self._output_dir) / f"{slug}_progress.jsonl"
+            self._open_progress(Path(self._output_dir) / f"{slug}_progress.jsonl")
+        self._warm_neo4j()
 
         initial_state = ResearchState(
             subject=SubjectProfile(
@@ -621,22 +735,17 @@ class ResearchGraph:
             "recursion_limit": max_iter * 10 + 20,
             "configurable": {"thread_id": slug},
         }
-        if settings.observability.tracing_enabled:
+        if self._tracing_enabled:
             run_config["run_name"] = f"investigate:{subject_name}"
 
+        # Checkpoint once when the run exits (including on error, for recovery below) rather than every step
         try:
-            if settings.observability.tracing_enabled:
-                with tracing_v2_enabled(project_name=settings.observability.langsmith_project):
-                    final_state_dict = await self.graph.ainvoke(
-                        initial_state.model_dump(),
-                        config=run_config,
-                    )
-            else:
-                final_state_dict = await self.graph.ainvoke(
-                    initial_state.model_dump(),
+            with self._tracing_context():
+                final_state: ResearchState = await self.graph.ainvoke(
+                    initial_state,
                     config=run_config,
+                    durability="exit",
                 )
-            final_state = ResearchState(**final_state_dict)
         except Exception as e:
             logger.error("investigation_error", error=str(e))
             # Try to recover last checkpoint state before falling back to empty initial_state
@@ -646,8 +755,10 @@ class ResearchGraph:
                     checkpoint = self._checkpointer.get(
                         {"configurable": {"thread_id": slug}}
                     )
-                    if checkpoint and checkpoint.get("channel_values"):
-                        final_state = ResearchState(**checkpoint["channel_values"])
+                    # The ResearchState is carried whole in the graph's single root channel
+                    values = checkpoint["channel_values"].get("__root__") if checkpoint else None
+                    if isinstance(values, ResearchState):
+                        final_state = values
                         recovered = True
                         logger.info("recovered_from_checkpoint", entities=len(final_state.entities))
                 except Exception:
@@ -657,16 +768,30 @@ class ResearchGraph:
             final_state.error_log.append(f"Investigation failed: {e}")
             if not final_state.final_report or final_state.final_report.startswith("Investigation terminated"):
                 final_state.final_report = f"Investigation terminated due to error: {e}"
+        finally:
+            await self._flush_debug_writes()
+            self._close_progress()
+            # Leave the connection open for the next run, but don't leave its connect task dangling
+            await self._await_neo4j_connect()
 
         final_state.estimated_cost_usd = self.llm_client.total_cost
         duration = round(time.time() - start_time, 1)
         status = "failed" if any("Investigation failed" in (e or "") for e in final_state.error_log) else ("error" if final_state.error_log else "complete")
+        # Tally the result once; metrics, the completion log and the run metadata all report the same counts
+        counts = {
+            "entities_found": len(final_state.entities),
+            "connections_found": len(final_state.connections),
+            "risk_flags_count": len(final_state.risk_flags),
+            "sources_accessed": len(final_state.search_history),
+            "sources_failed": len(final_state.inaccessible_urls),
+            "error_count": len(final_state.error_log),
+        }
         obs_metrics.investigation_completed(
             investigation_id=slug or "unknown",
             persona="default",
             status=status,
             cost_usd=final_state.estimated_cost_usd,
-            entity_count=len(final_state.entities),
+            entity_count=counts["entities_found"],
             risk_flags=self._count_risks_by_severity(final_state),
             confidence=getattr(final_state, "overall_confidence", 0.0) or 0.0,
             duration_seconds=duration,
@@ -675,9 +800,9 @@ class ResearchGraph:
             "investigation_complete",
             subject=subject_name,
             duration_seconds=duration,
-            entities=len(final_state.entities),
-            connections=len(final_state.connections),
-            risk_flags=len(final_state.risk_flags),
+            entities=counts["entities_found"],
+            connections=counts["connections_found"],
+            risk_flags=counts["risk_flags_count"],
             iterations=final_state.iteration,
             llm_calls=final_state.total_llm_calls,
             search_calls=final_state.total_search_calls,
@@ -686,7 +811,7 @@ class ResearchGraph:
 
         # Build and save run metadata
         termination = "completed"
-        if final_state.error_log:
+        if counts["error_count"]:
             termination = "error"
         elif final_state.should_terminate:
             termination = "terminated_by_director"
@@ -699,23 +824,16 @@ class ResearchGraph:
             duration_seconds=duration,
             total_cost_usd=final_state.estimated_cost_usd,
             iterations=final_state.iteration,
-            phases_executed=getattr(final_state, "_phases_executed", []),
-            entities_found=len(final_state.entities),
-            connections_found=len(final_state.connections),
-            risk_flags_count=len(final_state.risk_flags),
-            sources_accessed=len(final_state.search_history),
-            sources_failed=len(final_state.inaccessible_urls),
+            phases_executed=list(getattr(final_state, "_phases_executed", ())),
             termination_reason=termination,
-            error_count=len(final_state.error_log),
+            **counts,
         )
         try:
             out_path = Path(self._output_dir)
             out_path.mkdir(parents=True, exist_ok=True)
             meta_path = out_path / f"{slug}_metadata.json"
-            meta_path.write_text(
-                json.dumps(metadata.model_dump(), indent=2, default=str),
-                encoding="utf-8",
-            )
+            # The progress file was closed (flushed) in the finally above, so metadata appearing marks a finished run
+            await asyncio.to_thread(_write_atomic, meta_path, _encode_json(metadata.model_dump()))
             logger.info("run_metadata_saved", path=str(meta_path))
         except Exception as e:
             logger.warning("run_metadata_save_error", error=str(e))
@@ -725,33 +843,36 @@ class ResearchGraph:
     @staticmethod
     def _count_risks_by_severity(state: ResearchState) -> dict[str, int]:
         """Return severity -> count for risk flags (for metrics)."""
-        counts: dict[str, int] = {}
-        for flag in state.risk_flags:
-            sev = flag.severity.value if hasattr(flag.severity, "value") else str(flag.severity)
-            counts[sev] = counts.get(sev, 0) + 1
-        return counts
+        return dict(Counter(getattr(flag.severity, "value", None) or str(flag.severity) for flag in state.risk_flags))
+
+    def _tracing_context(self) -> contextlib.AbstractContextManager[Any]:
+        """LangSmith tracing scope when enabled; the tracer machinery is only imported then."""
+        if not self._tracing_enabled:
+            return contextlib.nullcontext()
+        from langchain_core.tracers.context import tracing_v2_enabled
+
+        return tracing_v2_enabled(project_name=self._settings.observability.langsmith_project)
 
     async def resume(self, thread_id: str) -> ResearchState:
         """Resume a checkpointed investigation by thread_id."""
         logger.info("investigation_resuming", thread_id=thread_id)
-        settings = get_settings()
         run_config = {
             "recursion_limit": 32,
             "configurable": {"thread_id": thread_id},
+            **({"run_name": f"resume:{thread_id}"} if self._tracing_enabled else {}),
         }
-        if settings.observability.tracing_enabled:
-            run_config["run_name"] = f"resume:{thread_id}"
         try:
-            if settings.observability.tracing_enabled:
-                with tracing_v2_enabled(project_name=settings.observability.langsmith_project):
-                    final_state_dict = await self.graph.ainvoke(None, config=run_config)
-            else:
-                final_state_dict = await self.graph.ainvoke(None, config=run_config)
-            return ResearchState(**final_state_dict)
+            with self._tracing_context():
+                state: ResearchState = await self.graph.ainvoke(None, config=run_config)
+                return state
         except Exception as e:
             logger.error("resume_error", error=str(e))
             raise
 
     async def cleanup(self) -> None:
+        await self._flush_debug_writes()
+        if self._debug_writer is not None:
+            self._debug_writer.shutdown()
         await self.search.close()
+        await self._await_neo4j_connect()
         await self.neo4j.close()
@@ -7,15 +7,19 @@ Labels and relationship types are allowlisted to prevent Cypher injection.
 
 from __future__ import annotations
 
+import asyncio
 import re
+import time
+from contextlib import AbstractAsyncContextManager, nullcontext
 from datetime import datetime, timezone
-from typing import Any, Optional
+from typing import Any, Optional, TypeVar
 
+import orjson
 import structlog
-from neo4j import AsyncDriver, AsyncGraphDatabase
+from neo4j import AsyncDriver, AsyncGraphDatabase, AsyncManagedTransaction, AsyncSession
 
 from src.config import get_settings
-from src.models import EntityType, ResearchState
+from src.models import Entity, EntityType, ResearchState
 from src.observability import metrics as obs_metrics
 
 logger = structlog.get_logger()
@@ -65,11 +69,190 @@ VALID_REL_TYPES = frozenset(
 )
 
 
+# persist_state statements, one per label / (source label, target label, rel type), built once at import.
+# Reusing the exact text each run also keeps hits in Neo4j's query-plan cache, which is keyed by query string.
+_ENTITY_LABELS = VALID_NODE_LABELS - {"RiskFlag"}
+ENTITY_MERGE_CYPHER: dict[str, str] = {
+    label: f"UNWIND $rows AS row MERGE (n:{label} {{entity_id: row.entity_id}}) SET n += row.props"
+    for label in _ENTITY_LABELS
+}
+# Edges stay one streaming pipeline (UNWIND -> MATCH -> MATCH -> MERGE -> SET, no WITH/collect in between):
+# the MATCHes only read nodes and the MERGE only writes the edge, so the planner has no reason to add Eager
+EDGE_MERGE_CYPHER: dict[tuple[str, str, str], str] = {
+    (src_label, tgt_label, rel_type): (
+        "UNWIND $rows AS row"
+        f" MATCH (a:{src_label} {{entity_id: row.src_id}})"
+        f" MATCH (b:{tgt_label} {{entity_id: row.tgt_id}})"
+        f" MERGE (a)-[r:{rel_type}]->(b)"
+        " SET r += row.props"
+    )
+    for src_label in _ENTITY_LABELS
+    for tgt_label in _ENTITY_LABELS
+    for rel_type in VALID_REL_TYPES
+}
+RISK_FLAG_MERGE_CYPHER = "UNWIND $rows AS row MERGE (r:RiskFlag {flag_id: row.flag_id}) SET r += row.props"
+# Fresh-graph variants (right after clear_graph): no existence check; entity props already carry entity_id
+ENTITY_CREATE_CYPHER: dict[str, str] = {
+    label: f"UNWIND $rows AS row CREATE (n:{label}) SET n = row.props" for label in _ENTITY_LABELS
+}
+RISK_FLAG_CREATE_CYPHER = "UNWIND $rows AS row CREATE (r:RiskFlag) SET r = row.props, r.flag_id = row.flag_id"
+FLAGGED_FOR_CYPHER: dict[str, str] = {
+    label: (
+        "UNWIND $rows AS row"
+        " MATCH (r:RiskFlag {flag_id: row.flag_id})"
+        f" MATCH (e:{label} {{entity_id: row.entity_id}})"
+        " MERGE (r)-[:FLAGGED_FOR]->(e)"
+    )
+    for label in _ENTITY_LABELS
+}
+
+
+# Variable-length bounds can't be query parameters, so each allowed max_hops gets its own prebuilt statement
+# (the methods clamp max_hops into these ranges); stable text per bound keeps Neo4j's plan cache hits
+QUERY_CONNECTIONS_CYPHER: dict[int, str] = {
+    hops: (
+        f"MATCH path = (start {{name: $name}})-[*1..{hops}]-(connected) "
+        "RETURN start.name AS source, "
+        "[r IN relationships(path) | type(r)] AS relationship_chain, "
+        "[n IN nodes(path) | n.name] AS entity_chain, length(path) AS hops "
+        "ORDER BY hops LIMIT 50"
+    )
+    for hops in range(1, 11)
+}
+SHORTEST_PATH_CYPHER: dict[int, str] = {
+    hops: (
+        "MATCH (a {name: $name_a}), (b {name: $name_b}),"
+        f" path = shortestPath((a)-[*..{hops}]-(b))"
+        " RETURN [n IN nodes(path) | n.name] AS entity_chain,"
+        " [r IN relationships(path) | type(r)] AS relationship_chain,"
+        " length(path) AS hops"
+    )
+    for hops in range(1, 11)
+}
+SHORTEST_PATHS_CYPHER: dict[int, str] = {
+    hops: (
+        "MATCH (a {name: $name_a})"
+        " UNWIND $targets AS target"
+        " MATCH (b {name: target})"
+        f" MATCH path = shortestPath((a)-[*..{hops}]-(b))"
+        " RETURN target, [n IN nodes(path) | n.name] AS entity_chain,"
+        " [r IN relationships(path) | type(r)] AS relationship_chain,"
+        " length(path) AS hops"
+    )
+    for hops in range(1, 11)
+}
+MULTI_PATH_CYPHER: dict[int, str] = {
+    hops: (
+        f"MATCH (start {{name: $name}})-[*1..{hops}]-(connected)"
+        " WITH connected, count(*) AS path_count"
+        " WHERE path_count >= 2"
+        " RETURN connected.name AS name, connected.entity_type AS type,"
+        " path_count ORDER BY path_count DESC LIMIT 20"
+    )
+    for hops in range(1, 6)
+}
+
+# Read-query result cache: entries live this long (other writers may change the graph) and at most this many
+READ_CACHE_TTL_S = 60.0
+READ_CACHE_MAX = 512
+
+_Rows = list[dict[str, Any]]
+_RowsByTarget = dict[str, list[dict[str, Any]]]
+_CachedT = TypeVar("_CachedT", _Rows, _RowsByTarget)
+
+
+def _copy_rows(rows: _Rows | _RowsByTarget) -> _Rows | _RowsByTarget:
+    """Copy down to the row dicts, so callers mutating a result can't change what the cache holds."""
+    if isinstance(rows, dict):
+        return {target: [dict(row) for row in target_rows] for target, target_rows in rows.items()}
+    return [dict(row) for row in rows]
+
+# Rows per UNWIND statement: bounds each write transaction's size (and lock footprint) on large investigations
+WRITE_BATCH_ROWS = 1000
+
+
+def _batches(rows: list[dict[str, Any]]) -> list[list[dict[str, Any]]]:
+    return [rows[i : i + WRITE_BATCH_ROWS] for i in range(0, len(rows), WRITE_BATCH_ROWS)]
+
+
+async def _run_write(tx: AsyncManagedTransaction, cypher: str, rows: list[dict[str, Any]]) -> None:
+    result = await tx.run(cypher, rows=rows)
+    await result.consume()
+
+
+# Every entity label gets a uniqueness constraint on entity_id (which also backs the MERGE / edge-endpoint
+# lookups with an index) and a name index (name-keyed discovery queries)
+SCHEMA_CONSTRAINTS: tuple[str, ...] = (
+    *(
+        f"CREATE CONSTRAINT IF NOT EXISTS FOR (n:{label}) REQUIRE n.entity_id IS UNIQUE"
+        for label in sorted(_ENTITY_LABELS)
+    ),
+    "CREATE CONSTRAINT IF NOT EXISTS FOR (r:RiskFlag) REQUIRE r.flag_id IS UNIQUE",
+)
+SCHEMA_INDEXES: tuple[str, ...] = (
+    *(f"CREATE INDEX IF NOT EXISTS FOR (n:{label}) ON (n.name)" for label in sorted(_ENTITY_LABELS)),
+    "CREATE INDEX IF NOT EXISTS FOR (rf:RiskFlag) ON (rf.severity)",
+    "CREATE INDEX IF NOT EXISTS FOR (n:Person) ON (n.investigation_id)",
+    "CREATE INDEX IF NOT EXISTS FOR (n:Organization) ON (n.investigation_id)",
+)
+
+
+def _entity_props(entity: Entity, inv_id: str, updated_at: str) -> dict[str, Any]:
+    """Node properties for an entity; free-form attributes sit alongside the fixed fields (see _property_value)."""
+    props: dict[str, Any] = {
+        "entity_id": entity.id,
+        "name": entity.name,
+        "entity_type": entity.entity_type.value,
+        "confidence": entity.confidence,
+        "description": entity.description,
+        "aliases": entity.aliases,
+        "source_urls": entity.source_urls,
+        "investigation_id": inv_id,
+        "updated_at": updated_at,
+    }
+    # Filled in place (no intermediate dict to unpack)
+    for key, value in entity.attributes.items():
+        props[key] = _property_value(value)
+    return props
+
+
+_PROPERTY_SCALARS = (str, bool, int, float)
+
+
+def _property_value(value: Any) -> Any:
+    """Attribute value as a Neo4j property value.
+
+    Scalars and homogeneous scalar lists pass through natively (numbers stay numbers); anything Bolt can't
+    store as a property (maps, mixed lists, other objects) is stored as its JSON text.
+    """
+    if value is None or type(value) in _PROPERTY_SCALARS:
+        return value
+    if isinstance(value, list):
+        if not value:
+            return value
+        first = type(value[0])
+        if first in _PROPERTY_SCALARS and all(type(v) is first for v in value):
+            return value
+    return orjson.dumps(value, default=str).decode()
+
+
 def _safe_label(label: str) -> str:
     """Return label if allowlisted, else Entity."""
     return label if label in VALID_NODE_LABELS else "Entity"
 
 
+_ENTITY_TYPE_LABELS: dict[EntityType, str] = {
+    EntityType.PERSON: "Person",
+    EntityType.ORGANIZATION: "Organization",
+    EntityType.LOCATION: "Location",
+    EntityType.EVENT: "Event",
+    EntityType.DOCUMENT: "Document",
+    EntityType.FINANCIAL_INSTRUMENT: "FinancialInstrument",
+}
+# Allowlist already applied, so the persist hot path is a single lookup (unmapped types fall back to Entity)
+_ENTITY_LABEL_BY_TYPE: dict[EntityType, str] = {et: _safe_label(label) for et, label in _ENTITY_TYPE_LABELS.items()}
+
+
 def _safe_rel_type(rel: str) -> str:
     """Return relationship type if allowlisted, else RELATED_TO."""
     return rel if rel in VALID_REL_TYPES else "RELATED_TO"
@@ -85,12 +268,25 @@ class Neo4jClient:
         self._username = settings.neo4j.username
         self._password = settings.neo4j.password
         self._database = settings.neo4j.database
+        self._pool_size: int = max(1, settings.neo4j.pool_size)
+        self._connection_acquisition_timeout: float = settings.neo4j.connection_acquisition_timeout
+        self._connection_timeout: float = settings.neo4j.connection_timeout
+        self._max_transaction_retry_time: float = settings.neo4j.max_transaction_retry_time
+        self._keep_alive: bool = settings.neo4j.keep_alive
+        self._schema_ready = False  # Constraints/indexes created for the current driver
+        # Read-query results, (expires_at, rows) by (method, *args); dropped whenever this client writes
+        self._read_cache: dict[tuple[Any, ...], tuple[float, _Rows | _RowsByTarget]] = {}
 
     async def connect(self) -> None:
         try:
             self._driver = AsyncGraphDatabase.driver(
                 self._uri,
                 auth=(self._username, self._password),
+                max_connection_pool_size=self._pool_size,
+                connection_acquisition_timeout=self._connection_acquisition_timeout,
+                connection_timeout=self._connection_timeout,
+                max_transaction_retry_time=self._max_transaction_retry_time,
+                keep_alive=self._keep_alive,
             )
             await self._driver.verify_connectivity()
             logger.info("neo4j_connected", uri=self._uri)
@@ -101,6 +297,9 @@ class Neo4jClient:
     async def close(self) -> None:
         if self._driver:
             await self._driver.close()
+            self._driver = None
+            self._schema_ready = False
+            self._read_cache.clear()
 
     @property
     def is_connected(self) -> bool:
@@ -109,164 +308,153 @@ class Neo4jClient:
     async def clear_graph(self) -> None:
         if not self.is_connected:
             return
+        self._read_cache.clear()
         async with self._driver.session(database=self._database) as session:
             await session.run("MATCH (n) DETACH DELETE n")
             logger.info("neo4j_graph_cleared")
 
-    async def create_constraints(self) -> None:
+    async def create_constraints(self, session: Optional[AsyncSession] = None) -> None:
         if not self.is_connected:
             return
-        constraints = [
-            "CREATE CONSTRAINT IF NOT EXISTS FOR (p:Person) REQUIRE p.entity_id IS UNIQUE",
-            "CREATE CONSTRAINT IF NOT EXISTS FOR (o:Organization) REQUIRE o.entity_id IS UNIQUE",
-            "CREATE CONSTRAINT IF NOT EXISTS FOR (e:Event) REQUIRE e.entity_id IS UNIQUE",
-            "CREATE CONSTRAINT IF NOT EXISTS FOR (r:RiskFlag) REQUIRE r.flag_id IS UNIQUE",
-        ]
-        async with self._driver.session(database=self._database) as session:
-            for cypher in constraints:
+        async with self._reuse_or_open(session) as s:
+            for cypher in SCHEMA_CONSTRAINTS:
                 try:
-                    await session.run(cypher)
+                    await s.run(cypher)
                 except Exception as e:
                     logger.debug("constraint_exists", error=str(e))
 
-    async def ensure_indexes(self) -> None:
+    async def ensure_indexes(self, session: Optional[AsyncSession] = None) -> None:
         """Create indexes on first use for query performance."""
         if not self.is_connected:
             return
-        indexes = [
-            "CREATE INDEX IF NOT EXISTS FOR (p:Person) ON (p.name)",
-            "CREATE INDEX IF NOT EXISTS FOR (o:Organization) ON (o.name)",
-            "CREATE INDEX IF NOT EXISTS FOR (l:Location) ON (l.name)",
-            "CREATE INDEX IF NOT EXISTS FOR (rf:RiskFlag) ON (rf.flag_id)",
-            "CREATE INDEX IF NOT EXISTS FOR (rf:RiskFlag) ON (rf.severity)",
-            "CREATE INDEX IF NOT EXISTS FOR (n:Person) ON (n.investigation_id)",
-            "CREATE INDEX IF NOT EXISTS FOR (n:Organization) ON (n.investigation_id)",
-        ]
-        async with self._driver.session(database=self._database) as session:
-            for cypher in indexes:
+        async with self._reuse_or_open(session) as s:
+            for cypher in SCHEMA_INDEXES:
                 try:
-                    await session.run(cypher)
+                    await s.run(cypher)
                 except Exception as e:
                     logger.debug("index_creation_skipped", cypher=cypher[:50], error=str(e))
 
-    async def persist_state(self, state: ResearchState) -> dict[str, int]:
-        """Persist investigation state to Neo4j. Uses allowlisted labels only."""
+    def _reuse_or_open(self, session: Optional[AsyncSession]) -> AbstractAsyncContextManager[AsyncSession]:
+        """The caller's session if given (left open), else a new one closed on exit."""
+        if session is not None:
+            return nullcontext(session)
+        return self._driver.session(database=self._database)
+
+    async def persist_state(self, state: ResearchState, fresh_graph: bool = False) -> dict[str, int]:
+        """Persist investigation state to Neo4j. Uses allowlisted labels only.
+
+        Pass fresh_graph=True right after clear_graph(): entity and RiskFlag nodes are then CREATEd, skipping
+        MERGE's existence check (nothing can exist yet). Relationships are MERGEd either way.
+        """
         if not self.is_connected:
             logger.warning("neo4j_not_connected_skipping_persist")
             return {"nodes": 0, "relationships": 0}
 
-        await self.create_constraints()
-        await self.ensure_indexes()
+        self._read_cache.clear()
         inv_id = _investigation_id_from_state(state)
         updated_at = datetime.now(timezone.utc).isoformat()
         node_count = 0
         rel_count = 0
 
-        with obs_metrics.track_graph_query("persist_state"):
-            async with self._driver.session(database=self._database) as session:
-                for entity in state.entities:
-                    label = _safe_label(self._entity_type_to_label(entity.entity_type))
-                    props = {
-                        "entity_id": entity.id,
-                        "name": entity.name,
-                        "entity_type": entity.entity_type.value,
-                        "confidence": entity.confidence,
-                        "description": entity.description,
-                        "aliases": entity.aliases,
-                        "source_urls": entity.source_urls,
+        # One UNWIND statement per label / (labels, rel type) group instead of one round trip per row.
+        # Labels and rel types can't be parameters, so they select the prebuilt statement; the rest is row data.
+        label_by_id: dict[str, str] = {}
+        entity_rows: dict[str, list[dict[str, Any]]] = {}
+        # Keyed by id so a repeated entity/flag is written once (last copy wins, as successive MERGEs would)
+        for entity in {e.id: e for e in state.entities}.values():
+            label = _ENTITY_LABEL_BY_TYPE.get(entity.entity_type, "Entity")
+            label_by_id[entity.id] = label
+            entity_rows.setdefault(label, []).append(
+                {"entity_id": entity.id, "props": _entity_props(entity, inv_id, updated_at)}
+            )
+            node_count += 1
+
+        # Repeated (source, target, type) connections would MERGE onto the same edge anyway; keep only the last
+        # one (whose props a run of MERGE + SET would leave) so a batch never contends on one edge twice
+        edges: dict[tuple[str, str, str], dict[str, Any]] = {}
+        for conn in state.connections:
+            if conn.source_entity_id not in label_by_id or conn.target_entity_id not in label_by_id:
+                continue
+            rel_type = _safe_rel_type(conn.relationship_type.value)
+            # Edge attributes and provenance (temporal and source metadata) are set together
+            props = {
+                "description": conn.description,
+                "confidence": conn.confidence,
+                "source_urls": conn.source_urls,
+                "investigation_id": inv_id,
+                "updated_at": updated_at,
+                "extraction_timestamp": updated_at,
+                "source_url_primary": conn.source_urls[0] if conn.source_urls else "",
+                "start_date": conn.start_date or "",
+                "end_date": conn.end_date or "",
+            }
+            edges[(conn.source_entity_id, conn.target_entity_id, rel_type)] = {
+                "src_id": conn.source_entity_id,
+                "tgt_id": conn.target_entity_id,
+                "props": props,
+            }
+        edge_rows: dict[tuple[str, str, str], list[dict[str, Any]]] = {}
+        for (src_id, tgt_id, rel_type), row in edges.items():
+            edge_rows.setdefault((label_by_id[src_id], label_by_id[tgt_id], rel_type), []).append(row)
+        rel_count += len(edges)
+
+        flag_rows: list[dict[str, Any]] = []
+        flag_link_rows: dict[str, list[dict[str, str]]] = {}
+        for flag in {f.id: f for f in state.risk_flags}.values():
+            flag_rows.append(
+                {
+                    "flag_id": flag.id,
+                    "props": {
+                        "category": flag.category.value,
+                        "severity": flag.severity.value,
+                        "title": flag.title,
+                        "description": flag.description,
+                        "confidence": flag.confidence,
+                        "evidence": flag.evidence,
                         "investigation_id": inv_id,
-                        "updated_at": updated_at,
-                        **{k: str(v) for k, v in entity.attributes.items()},
-                    }
-                    # Label is allowlisted; use parameterized props only
-                    cypher = f"MERGE (n:{label} {{entity_id: $entity_id}}) SET n += $props"
-                    await session.run(cypher, entity_id=entity.id, props=props)
-                    node_count += 1
-
-                for conn in state.connections:
-                    src = state.get_entity_by_id(conn.source_entity_id)
-                    tgt = state.get_entity_by_id(conn.target_entity_id)
-                    if not src or not tgt:
-                        continue
-                    src_label = _safe_label(self._entity_type_to_label(src.entity_type))
-                    tgt_label = _safe_label(self._entity_type_to_label(tgt.entity_type))
-                    rel_type = _safe_rel_type(conn.relationship_type.value)
-                    cypher = (
-                        f"MATCH (a:{src_label} {{entity_id: $src_id}})"
-                        f" MATCH (b:{tgt_label} {{entity_id: $tgt_id}})"
-                        f" MERGE (a)-[r:{rel_type}]->(b)"
-                        " SET r.description = $desc, r.confidence = $conf, r.source_urls = $urls,"
-                        " r.investigation_id = $inv_id, r.updated_at = $updated_at"
-                    )
-                    await session.run(
-                        cypher,
-                        src_id=conn.source_entity_id,
-                        tgt_id=conn.target_entity_id,
-                        desc=conn.description,
-                        conf=conn.confidence,
-                        urls=conn.source_urls,
-                        inv_id=inv_id,
-                        updated_at=updated_at,
-                    )
-                    # Edge provenance: temporal and source metadata
-                    provenance_cypher = (
-                        f"MATCH (a:{src_label} {{entity_id: $src_id}})"
-                        f"-[r:{rel_type}]->"
-                        f"(b:{tgt_label} {{entity_id: $tgt_id}})"
-                        " SET r.extraction_timestamp = $ts,"
-                        " r.source_url_primary = $primary_url,"
-                        " r.start_date = $start_date,"
-                        " r.end_date = $end_date"
-                    )
-                    await session.run(
-                        provenance_cypher,
-                        src_id=conn.source_entity_id,
-                        tgt_id=conn.target_entity_id,
-                        ts=updated_at,
-                        primary_url=conn.source_urls[0] if conn.source_urls else "",
-                        start_date=conn.start_date or "",
-                        end_date=conn.end_date or "",
-                    )
+                    },
+                }
+            )
+            node_count += 1
+            for eid in dict.fromkeys(flag.entity_ids):
+                entity_label = label_by_id.get(eid)
+                if entity_label:
+                    flag_link_rows.setdefault(entity_label, []).append({"flag_id": flag.id, "entity_id": eid})
                     rel_count += 1
 
-                for flag in state.risk_flags:
-                    await session.run(
-                        "MERGE (r:RiskFlag {flag_id: $flag_id}) SET r.category = $category, "
-                        "r.severity = $severity, r.title = $title, r.description = $description, "
-                        "r.confidence = $confidence, r.evidence = $evidence, "
-                        "r.investigation_id = $inv_id",
-                        flag_id=flag.id,
-                        category=flag.category.value,
-                        severity=flag.severity.value,
-                        title=flag.title,
-                        description=flag.description,
-                        confidence=flag.confidence,
-                        evidence=flag.evidence,
-                        inv_id=inv_id,
-                    )
-                    node_count += 1
-                    for eid in flag.entity_ids:
-                        entity = state.get_entity_by_id(eid)
-                        if entity:
-                            label = _safe_label(self._entity_type_to_label(entity.entity_type))
-                            link_cypher = (
-                                "MATCH (r:RiskFlag {flag_id: $flag_id})"
-                                f" MATCH (e:{label} {{entity_id: $entity_id}})"
-                                " MERGE (r)-[:FLAGGED_FOR]->(e)"
-                            )
-                            await session.run(link_cypher, flag_id=flag.id, entity_id=eid)
-                            rel_count += 1
-
-        node_counts_by_label: dict[str, int] = {}
-        for entity in state.entities:
-            label = _safe_label(self._entity_type_to_label(entity.entity_type))
-            node_counts_by_label[label] = node_counts_by_label.get(label, 0) + 1
-        for _ in state.risk_flags:
-            node_counts_by_label["RiskFlag"] = node_counts_by_label.get("RiskFlag", 0) + 1
+        with obs_metrics.track_graph_query("persist_state"):
+            # Schema DDL and the dependent writes share one session rather than acquiring one per step
+            async with self._driver.session(database=self._database) as session:
+                if not self._schema_ready:
+                    await self.create_constraints(session)
+                    await self.ensure_indexes(session)
+                    self._schema_ready = True
+                # Node groups touch disjoint labels, so they run concurrently (a session can't be shared
+                # across concurrent queries, so each takes its own from the pool). Edges and FLAGGED_FOR
+                # links need those nodes and can lock shared endpoints, so they stay serialized.
+                entity_cypher = ENTITY_CREATE_CYPHER if fresh_graph else ENTITY_MERGE_CYPHER
+                node_writes = [(entity_cypher[label], rows) for label, rows in entity_rows.items()]
+                if flag_rows:
+                    node_writes.append((RISK_FLAG_CREATE_CYPHER if fresh_graph else RISK_FLAG_MERGE_CYPHER, flag_rows))
+                # A TaskGroup cancels and awaits the other groups if one fails; its first error is re-raised as is
+                try:
+                    async with asyncio.TaskGroup() as tg:
+                        for cypher, rows in node_writes:
+                            tg.create_task(self._write_rows(cypher, rows))
+                except ExceptionGroup as eg:
+                    raise eg.exceptions[0] from eg
+                for key, rows in edge_rows.items():
+                    await self._write_rows(EDGE_MERGE_CYPHER[key], rows, session)
+                for label, rows in flag_link_rows.items():
+                    await self._write_rows(FLAGGED_FOR_CYPHER[label], rows, session)
+
+        # Graph stats come straight from the write buckets rather than another pass over the state
+        node_counts_by_label = {label: len(rows) for label, rows in entity_rows.items()}
+        if flag_rows:
+            node_counts_by_label["RiskFlag"] = len(flag_rows)
         edge_counts_by_type: dict[str, int] = {}
-        for conn in state.connections:
-            rel = _safe_rel_type(conn.relationship_type.value)
-            edge_counts_by_type[rel] = edge_counts_by_type.get(rel, 0) + 1
+        for (_, _, rel_type), rows in edge_rows.items():
+            edge_counts_by_type[rel_type] = edge_counts_by_type.get(rel_type, 0) + len(rows)
         obs_metrics.record_graph_stats(node_counts_by_label, edge_counts_by_type)
 
         logger.info(
@@ -276,21 +464,49 @@ class Neo4jClient:
         )
         return {"nodes": node_count, "relationships": rel_count}
 
+    async def _write_rows(
+        self, cypher: str, rows: list[dict[str, Any]], session: Optional[AsyncSession] = None
+    ) -> None:
+        """Run an UNWIND write, one managed transaction per row batch.
+
+        execute_write retries transient failures (e.g. deadlocks between concurrent MERGEs). Each managed
+        transaction is all-or-nothing, so a failed batch leaves nothing behind; but if a commit's outcome is
+        unknown and the batch is replayed, the CREATE statements of a fresh-graph write can hit a uniqueness
+        constraint error. Without a session one is opened, so the call can run concurrently with others.
+        """
+        async with self._reuse_or_open(session) as s:
+            for batch in _batches(rows):
+                await s.execute_write(_run_write, cypher, batch)
+
+    def _cached_read(self, key: tuple[Any, ...]) -> _Rows | _RowsByTarget | None:
+        """A private copy of the cached result for key, or None when absent or expired."""
+        entry = self._read_cache.get(key)
+        if entry is None:
+            return None
+        if entry[0] < time.monotonic():
+            del self._read_cache[key]
+            return None
+        return _copy_rows(entry[1])
+
+    def _cache_read(self, key: tuple[Any, ...], rows: _CachedT) -> _CachedT:
+        """Cache a copy of rows and hand the original back to the caller."""
+        if len(self._read_cache) >= READ_CACHE_MAX:
+            self._read_cache.pop(next(iter(self._read_cache)))  # Evict oldest insertion
+        self._read_cache[key] = (time.monotonic() + READ_CACHE_TTL_S, _copy_rows(rows))
+        return rows
+
     async def query_connections(self, entity_name: str, max_hops: int = 3) -> list[dict[str, Any]]:
         if not self.is_connected:
             return []
         if max_hops < 1 or max_hops > 10:
             max_hops = 3
-        cypher = (
-            f"MATCH path = (start {{name: $name}})-[*1..{max_hops}]-(connected) "
-            "RETURN start.name AS source, "
-            "[r IN relationships(path) | type(r)] AS relationship_chain, "
-            "[n IN nodes(path) | n.name] AS entity_chain, length(path) AS hops "
-            "ORDER BY hops LIMIT 50"
-        )
+        key = ("query_connections", entity_name, max_hops)
+        cached = self._cached_read(key)
+        if isinstance(cached, list):
+            return cached
         async with self._driver.session(database=self._database) as session:
-            result = await session.run(cypher, name=entity_name)
-            return [record.data() async for record in result]
+            result = await session.run(QUERY_CONNECTIONS_CYPHER[max_hops], name=entity_name)
+            return self._cache_read(key, await result.data())
 
     async def execute_read(self, cypher: str, parameters: Optional[dict[str, Any]] = None) -> list[dict[str, Any]]:
         """Run a read-only parameterized Cypher query; returns list of record dicts."""
@@ -299,7 +515,27 @@ class Neo4jClient:
         params = parameters or {}
         async with self._driver.session(database=self._database) as session:
             result = await session.run(cypher, params)
-            return [record.data() async for record in result]
+            return await result.data()
+
+    async def bulk_read(
+        self, specs: list[tuple[str, Optional[dict[str, Any]]]]
+    ) -> list[list[dict[str, Any]] | BaseException]:
+        """Run independent read queries concurrently over the driver's pool; results in spec order.
+
+        At most one query per pooled connection is in flight. A failed query yields its exception in place
+        of its rows, so one bad query doesn't discard the others.
+        """
+        if not self.is_connected:
+            return [[] for _ in specs]
+        slots = asyncio.Semaphore(self._pool_size)
+
+        async def run_one(cypher: str, parameters: Optional[dict[str, Any]]) -> list[dict[str, Any]]:
+            queued = time.perf_counter()
+            async with slots:
+                obs_metrics.record_graph_read_wait(time.perf_counter() - queued)
+                return await self.execute_read(cypher, parameters)
+
+        return await asyncio.gather(*(run_one(cypher, params) for cypher, params in specs), return_exceptions=True)
 
     async def get_graph_stats(self) -> dict[str, int]:
         if not self.is_connected:
@@ -321,37 +557,66 @@ class Neo4jClient:
         b_trimmed = (entity_b or "").strip()
         if not a_trimmed or not b_trimmed or a_trimmed == b_trimmed:
             return []
+        key = ("shortest_path", a_trimmed, b_trimmed, max_hops)
+        cached = self._cached_read(key)
+        if isinstance(cached, list):
+            return cached
         with obs_metrics.track_graph_query("shortest_path"):
-            cypher = (
-                "MATCH (a {name: $name_a}), (b {name: $name_b}),"
-                f" path = shortestPath((a)-[*..{max_hops}]-(b))"
-                " RETURN [n IN nodes(path) | n.name] AS entity_chain,"
-                " [r IN relationships(path) | type(r)] AS relationship_chain,"
-                " length(path) AS hops"
-            )
             try:
                 async with self._driver.session(database=self._database) as session:
-                    result = await session.run(cypher, name_a=a_trimmed, name_b=b_trimmed)
-                    return [record.data() async for record in result]
+                    result = await session.run(SHORTEST_PATH_CYPHER[max_hops], name_a=a_trimmed, name_b=b_trimmed)
+                    return self._cache_read(key, await result.data())
             except Exception as e:
                 logger.debug("shortest_path_failed", entity_a=a_trimmed, entity_b=b_trimmed, error=str(e))
                 return []
 
+    async def shortest_paths(
+        self, entity_a: str, targets: list[str], max_hops: int = 5
+    ) -> dict[str, list[dict[str, Any]]]:
+        """Find shortest paths from one named entity to many targets in a single query, keyed by target name."""
+        if not self.is_connected:
+            return {}
+        if max_hops < 1 or max_hops > 10:
+            max_hops = 5
+        a_trimmed = (entity_a or "").strip()
+        names = list(dict.fromkeys(t for t in ((name or "").strip() for name in targets) if t and t != a_trimmed))
+        if not a_trimmed or not names:
+            return {}
+        key = ("shortest_paths", a_trimmed, tuple(names), max_hops)
+        cached = self._cached_read(key)
+        if isinstance(cached, dict):
+            return cached
+        with obs_metrics.track_graph_query("shortest_paths"):
+            paths: dict[str, list[dict[str, Any]]] = {}
+            try:
+                async with self._driver.session(database=self._database) as session:
+                    result = await session.run(SHORTEST_PATHS_CYPHER[max_hops], name_a=a_trimmed, targets=names)
+                    async for record in result:
+                        row = record.data()
+                        paths.setdefault(row.pop("target"), []).append(row)
+            except Exception as e:
+                logger.debug("shortest_paths_failed", entity_a=a_trimmed, targets=names, error=str(e))
+                return {}
+            return self._cache_read(key, paths)
+
     async def detect_shell_companies(self) -> list[dict[str, Any]]:
         """Find organizations sharing a location. Only uses persisted properties (e.g. from entity attributes)."""
         if not self.is_connected:
             return []
         # Only query properties we explicitly persist (e.g. location from entity.attributes)
         # IS NOT NULL and <> '' avoid false positives from empty values
+        # Group by location in one scan, then pair up only within groups of 2+ (not every org against every org)
         cypher = """
-        MATCH (o1:Organization)
-        MATCH (o2:Organization)
+        MATCH (o:Organization)
+        WHERE o.location IS NOT NULL AND o.location <> ''
+        WITH o.location AS shared_location, collect(o) AS orgs
+        WHERE size(orgs) >= 2
+        UNWIND orgs AS o1
+        UNWIND orgs AS o2
+        WITH shared_location, o1, o2
         WHERE o1 <> o2
-          AND o1.location IS NOT NULL
-          AND o1.location = o2.location
-          AND o1.location <> ''
         RETURN o1.name AS org_a, o2.name AS org_b,
-               o1.location AS shared_location,
+               shared_location,
                'shared_address' AS link_type
         ORDER BY shared_location
         LIMIT 50
@@ -363,6 +628,10 @@ class Neo4jClient:
         """Most-connected nodes by relationship count."""
         if not self.is_connected:
             return []
+        key = ("degree_centrality", top_n)
+        cached = self._cached_read(key)
+        if isinstance(cached, list):
+            return cached
         with obs_metrics.track_graph_query("degree_centrality"):
             cypher = (
                 "MATCH (n)-[r]-()"
@@ -371,7 +640,7 @@ class Neo4jClient:
             )
             async with self._driver.session(database=self._database) as session:
                 result = await session.run(cypher, top_n=top_n)
-                return [record.data() async for record in result]
+                return self._cache_read(key, await result.data())
 
     async def multi_path_connections(self, entity_name: str, max_hops: int = 3) -> list[dict[str, Any]]:
         """Find entities connected through 2+ independent paths."""
@@ -379,24 +648,14 @@ class Neo4jClient:
             return []
         if max_hops < 1 or max_hops > 5:
             max_hops = 3
-        cypher = (
-            f"MATCH (start {{name: $name}})-[*1..{max_hops}]-(connected)"
-            " WITH connected, count(*) AS path_count"
-            " WHERE path_count >= 2"
-            " RETURN connected.name AS name, connected.entity_type AS type,"
-            " path_count ORDER BY path_count DESC LIMIT 20"
-        )
+        key = ("multi_path_connections", entity_name, max_hops)
+        cached = self._cached_read(key)
+        if isinstance(cached, list):
+            return cached
         async with self._driver.session(database=self._database) as session:
-            result = await session.run(cypher, name=entity_name)
-            return [record.data() async for record in result]
+            result = await session.run(MULTI_PATH_CYPHER[max_hops], name=entity_name)
+            return self._cache_read(key, await result.data())
 
     @staticmethod
     def _entity_type_to_label(entity_type: EntityType) -> str:
-        return {
-            EntityType.PERSON: "Person",
-            EntityType.ORGANIZATION: "Organization",
-            EntityType.LOCATION: "Location",
-            EntityType.EVENT: "Event",
-            EntityType.DOCUMENT: "Document",
-            EntityType.FINANCIAL_INSTRUMENT: "FinancialInstrument",
-        }.get(entity_type, "Entity")
+        return _ENTITY_TYPE_LABELS.get(entity_type, "Entity")
@@ -222,7 +222,7 @@ class LLMClient:
             os.environ.pop(_k, None)
 
         use_litellm = bool(settings.llm.litellm_api_key and settings.llm.litellm_api_key.strip())
-        base_url = (settings.llm.litellm_api_base or "").strip() or "http://localhost:4000"
+        base_url = settings.llm.litellm_api_base or "http://localhost:4000"
         api_key = (settings.llm.litellm_api_key or "").strip()
 
         def _is_localhost(url: str) -> bool:
@@ -20,6 +20,7 @@ import time
 from collections.abc import Callable
 from pathlib import Path
 
+import orjson
 import structlog
 from rich.console import Console
 from rich.layout import Layout
@@ -31,7 +32,7 @@ from rich.text import Text
 from rich.theme import Theme
 
 from src.config import get_settings
-from src.evaluation.eval_set import ALL_PERSONAS, get_persona
+from src.evaluation.eval_set import all_personas, get_persona
 from src.evaluation.metrics import evaluate
 from src.graph import ResearchGraph
 from src.models import ResearchState
@@ -261,6 +262,7 @@ async def run_investigation(
     live: bool = False,
     resume_thread_id: str | None = None,
     redact_pii: bool = False,
+    pretty_debug: bool = False,
 ) -> None:
     """Run a complete investigation and save results."""
     settings = get_settings()
@@ -298,6 +300,7 @@ async def run_investigation(
                 debug=debug,
                 output_dir=output_dir,
                 on_progress=on_progress,
+                pretty_debug=pretty_debug,
             )
             try:
                 state = await graph.investigate(
@@ -314,6 +317,7 @@ async def run_investigation(
             debug=debug,
             output_dir=output_dir,
             on_progress=None,
+            pretty_debug=pretty_debug,
         )
         try:
             state = await graph.investigate(
@@ -338,7 +342,9 @@ async def run_investigation(
     safe_name = subject_name.replace(" ", "_").lower()
 
     (out_path / f"{safe_name}_report.md").write_text(state.final_report or "No report")
-    (out_path / f"{safe_name}_state.json").write_text(json.dumps(state.model_dump(), indent=2, default=str))
+    # Final state can be MB-scale; orjson encodes straight to bytes several times faster than json.dumps
+    json_opts = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+    (out_path / f"{safe_name}_state.json").write_bytes(orjson.dumps(state.model_dump(), default=str, option=json_opts))
 
     # Save PII-redacted report if requested or if redacted content exists
     if redact_pii or state.redacted_report:
@@ -358,18 +364,18 @@ async def run_investigation(
         }
         for e in state.entities
     ]
-    (out_path / f"{safe_name}_entities.json").write_text(json.dumps(entities_data, indent=2, default=str))
+    (out_path / f"{safe_name}_entities.json").write_bytes(orjson.dumps(entities_data, default=str, option=json_opts))
     console.print(f"\n[green]Outputs saved to {out_path}/[/green]")
 
 
 async def run_evaluation(persona_name: str | None = None, run_all: bool = False) -> None:
     """Run evaluation against test personas."""
-    personas = ALL_PERSONAS if run_all else [get_persona(persona_name)] if persona_name else []
+    personas = list(all_personas()) if run_all else [get_persona(persona_name)] if persona_name else []
     personas = [p for p in personas if p is not None]
 
     if not personas:
         console.print("[red]No matching persona found.[/red]")
-        console.print("Available: " + ", ".join(p.name for p in ALL_PERSONAS))
+        console.print("Available: " + ", ".join(p.name for p in all_personas()))
         return
 
     for persona in personas:
@@ -485,7 +491,12 @@ def main() -> None:
     inv.add_argument(
         "--debug",
         action="store_true",
-        help="Write per-iteration snapshots and pipeline stage I/O to output_dir/subject/ and output_dir/pipeline_debug/ (step_N_nodename_in.json, step_N_nodename_out.json)",
+        help="Write per-iteration snapshots and pipeline stage I/O to output_dir/subject/ and output_dir/pipeline_debug/ (step_N_nodename.json with the node's in/out state)",
+    )
+    inv.add_argument(
+        "--pretty-debug",
+        action="store_true",
+        help="Indent --debug JSON dumps (default: compact, which is faster to write for large states)",
     )
     inv.add_argument(
         "--live",
@@ -529,6 +540,7 @@ def main() -> None:
                 getattr(args, "live", False),
                 getattr(args, "resume", None),
                 getattr(args, "redact_pii", False),
+                getattr(args, "pretty_debug", False),
             )
         )
     elif args.command == "evaluate":
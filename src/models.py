@@ -110,6 +110,7 @@ class AgentAction(str, Enum):
     ANALYZE_RISKS = "analyze_risks"
     MAP_CONNECTIONS = "map_connections"
     VERIFY_SOURCES = "verify_sources"
+    ANALYZE_ALL = "analyze_all"  # risk analysis + connection mapping + source verification, concurrently
     UPDATE_GRAPH = "update_graph"
     GENERATE_REPORT = "generate_report"
     TERMINATE = "terminate"
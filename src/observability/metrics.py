@@ -3,7 +3,8 @@ Prometheus metrics and optional OpenTelemetry for the Deep Research Agent.
 
 All metrics are no-op when observability.metrics_enabled is False.
 Exposes track_llm_call, record_llm_*, track_search, record_fetch, record_tier_escalation,
-track_graph_query, record_graph_stats, investigation_started/completed, track_phase, start_server.
+track_graph_query, record_graph_read_wait, record_graph_stats, investigation_started/completed,
+track_phase, start_server.
 """
 
 from __future__ import annotations
@@ -170,6 +171,11 @@ def _create_metrics() -> None:
         ["query_name"],
         buckets=[0.1, 0.5, 1, 2, 5],
     )
+    _graph_read_wait = Histogram(
+        "graph_read_wait_seconds",
+        "Time a bulk Neo4j read waited for a concurrency slot",
+        buckets=[0.001, 0.01, 0.05, 0.1, 0.5, 1],
+    )
 
     # Store on module for access from MetricsCollector
     _registry = {
@@ -194,6 +200,7 @@ def _create_metrics() -> None:
         "graph_nodes": _graph_nodes,
         "graph_edges": _graph_edges,
         "graph_query_duration": _graph_query_duration,
+        "graph_read_wait": _graph_read_wait,
     }
     setattr(_MetricsCollector, "_registry", _registry)
 
@@ -346,6 +353,11 @@ class _MetricsCollector:
             if h:
                 h.labels(query_name=query_name or "unknown").observe(time.perf_counter() - start)
 
+    def record_graph_read_wait(self, seconds: float) -> None:
+        h = self._get("graph_read_wait")
+        if h:
+            h.observe(seconds)
+
     def record_graph_stats(
         self,
         node_counts_by_label: dict[str, int],
@@ -35,10 +35,11 @@ Your job is to PLAN the next step of an investigation. You analyze what has been
 - Prefer specific, targeted queries over broad ones
 - When in ADVERSARIAL phase, search for: litigation, bankruptcy, sanctions, regulatory actions, negative news, removed articles
 - Before generating the report, you MUST run risk analysis at least once when there are entities and connections: if Risk Flags is 0 and you have not yet chosen next_action "analyze_risks" in this investigation, prefer next_action "analyze_risks" so the judge can flag SEC, litigation, and other risks from the findings.
+- When risks, connections, and source confidence all need a pass, choose next_action "analyze_all" to run the three analyses together in one step instead of one per iteration.
 - TERMINATE when: (a) confidence_in_completeness > 0.8, OR (b) max_iterations reached, OR (c) consecutive iterations yield few new entities
 </decision_rules>
 
-You MUST respond with a JSON object. Include: "reasoning", "next_action" (search_web|extract_facts|analyze_risks|map_connections|verify_sources|generate_report|terminate), "search_queries" (array), "current_phase", "confidence_in_completeness" (0-1), "gaps_identified" (array). Think step-by-step about what we know, what gaps remain, and what queries will fill them."""
+You MUST respond with a JSON object. Include: "reasoning", "next_action" (search_web|extract_facts|analyze_risks|map_connections|verify_sources|analyze_all|generate_report|terminate), "search_queries" (array), "current_phase", "confidence_in_completeness" (0-1), "gaps_identified" (array). Think step-by-step about what we know, what gaps remain, and what queries will fill them."""
 
 
 RESEARCH_DIRECTOR_USER_TEMPLATE = """<subject_profile>
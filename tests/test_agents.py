@@ -6,6 +6,7 @@ from unittest.mock import AsyncMock, patch
 
 import pytest
 
+from src.agents.entity_resolver import EntityResolver
 from src.agents.fact_extractor import FactExtractionAgent
 from src.agents.report_generator import ReportGenerator
 from src.agents.research_director import ResearchDirector
@@ -14,8 +15,10 @@ from src.agents.risk_debate import RiskProponentAgent, RiskSkepticAgent
 from src.llm_client import LLMClient
 from src.models import (
     AgentAction,
+    Connection,
     Entity,
     EntityType,
+    RelationshipType,
     ResearchState,
     RiskCategory,
     RiskFlag,
@@ -182,6 +185,37 @@ class TestFactExtractorZeroYieldRecording:
         assert empty_state.entities_added_per_iteration[0] == 0
 
 
+class TestEntityResolverMerge:
+    """Confirmed merge pairs fold duplicates into the surviving entity and repoint connections."""
+
+    def test_merge_pairs(self, empty_state: ResearchState) -> None:
+        resolver = EntityResolver(LLMClient(budget_usd=0))
+        acme = empty_state.add_entity(Entity(name="Acme Corp", entity_type=EntityType.ORGANIZATION))
+        acme_inc = empty_state.add_entity(Entity(name="Acme Inc", entity_type=EntityType.ORGANIZATION))
+        acme_llc = empty_state.add_entity(Entity(name="Acme LLC", entity_type=EntityType.ORGANIZATION))
+        person = empty_state.add_entity(Entity(name="Test Person", entity_type=EntityType.PERSON))
+        empty_state.add_connection(
+            Connection(
+                source_entity_id=person.id,
+                target_entity_id=acme_llc.id,
+                relationship_type=RelationshipType.WORKS_AT,
+            )
+        )
+        merged = resolver._merge_entities(
+            empty_state,
+            [
+                {"entity_a_id": acme.id, "entity_b_id": acme_inc.id},
+                {"entity_a_id": acme.id, "entity_b_id": acme_llc.id},
+                {"entity_a_id": acme_inc.id, "entity_b_id": person.id},  # acme_inc already merged away
+                {"entity_a_id": person.id, "entity_b_id": person.id},
+            ],
+        )
+        assert merged == 2
+        assert [e.name for e in empty_state.entities] == ["Acme Corp", "Test Person"]
+        assert sorted(acme.aliases) == ["Acme Inc", "Acme LLC"]
+        assert empty_state.connections[0].target_entity_id == acme.id
+
+
 class TestRiskDebate:
     """Adversarial debate: proponent and skeptic arguments are passed to the judge."""
 
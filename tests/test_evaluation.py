@@ -0,0 +1,180 @@
+"""Unit tests for the evaluation harness (persona registry and scoring)."""
+
+import dataclasses
+from pathlib import Path
+
+import pytest
+
+from src.evaluation import eval_set, metrics
+from src.evaluation.eval_set import TestPersona as Persona
+from src.evaluation.eval_set import all_personas, get_persona
+from src.evaluation.metrics import evaluate
+from src.models import (
+    Connection,
+    Entity,
+    EntityType,
+    RelationshipType,
+    ResearchState,
+    SubjectProfile,
+)
+
+
+@pytest.fixture
+def hard_persona() -> Persona:
+    persona = get_persona("hard")
+    assert persona is not None
+    return persona
+
+
+@pytest.fixture
+def overturf_state() -> ResearchState:
+    """Partial investigation of the hard persona: some facts, entities, and one connection."""
+    state = ResearchState(
+        subject=SubjectProfile(
+            full_name="Timothy Overturf",
+            current_role="CEO",
+            current_organization="Sisu Capital",
+        )
+    )
+    tim = state.add_entity(Entity(name="Timothy Overturf", entity_type=EntityType.PERSON))
+    sisu = state.add_entity(
+        Entity(name="Sisu Capital, LLC", entity_type=EntityType.ORGANIZATION, aliases=["Sisu Capital"])
+    )
+    state.add_entity(
+        Entity(name="Hansueli Overturf", entity_type=EntityType.PERSON, description="Father; SEC complaint")
+    )
+    state.add_connection(
+        Connection(
+            source_entity_id=tim.id,
+            target_entity_id=sisu.id,
+            relationship_type=RelationshipType.WORKS_AT,
+            description="CEO and founder",
+        )
+    )
+    state.final_report = (
+        "SEC enforcement action filed in the Northern District of California (San Francisco), "
+        "case 3:23-cv-03855. Allegations of breach of fiduciary duty under the Investment Advisers Act, "
+        "self-dealing and unsuitable trading in client accounts. "
+        "Sisu Capital is a registered investment adviser (RIA)."
+    )
+    return state
+
+
+class TestPersonaRegistry:
+    """Personas are built lazily and looked up by name or difficulty."""
+
+    def test_all_personas_built_once(self) -> None:
+        assert all_personas() is all_personas()
+        assert len(all_personas()) == 5
+
+    def test_missing_or_empty_ground_truth_raises(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(eval_set, "_PERSONAS_FILE", tmp_path / "eval_personas.yaml")
+        all_personas.cache_clear()
+        try:
+            with pytest.raises(FileNotFoundError):
+                all_personas()
+            (tmp_path / "eval_personas.yaml").write_text("personas: []\n")
+            with pytest.raises(ValueError, match="no personas"):
+                all_personas()
+        finally:
+            all_personas.cache_clear()
+
+    def test_get_persona_by_difficulty(self) -> None:
+        persona = get_persona("hard")
+        assert persona is not None
+        assert persona.name == "Timothy Overturf"
+
+    def test_get_persona_by_name_case_insensitive(self) -> None:
+        persona = get_persona("  sam altman ")
+        assert persona is not None
+        assert persona.current_org == "OpenAI"
+
+    def test_get_persona_unknown(self) -> None:
+        assert get_persona("nobody") is None
+
+    def test_search_keywords_preserved(self) -> None:
+        persona = get_persona("hard")
+        assert persona is not None
+        keyword_facts = [f for f in persona.expected_facts if f.search_keywords]
+        assert keyword_facts
+        assert all(f.depth >= 3 for f in keyword_facts)
+
+    def test_expected_connections_membership(self) -> None:
+        persona = get_persona("hard")
+        assert persona is not None
+        assert ("Timothy Overturf", "Sisu Capital", "FOUNDED") in persona.expected_connections
+        assert len(persona.expected_connections) == 3
+
+
+class TestEvaluate:
+    """Scoring against ground truth: fact, entity, and connection recall."""
+
+    def test_fact_recall(self, overturf_state: ResearchState, hard_persona: Persona) -> None:
+        result = evaluate(overturf_state, hard_persona)
+        assert result.expected_facts == 15
+        assert result.discovered_facts == 8
+        assert "Northern District of California or N.D. Cal. court case" in result.matched_facts
+        assert "California DFPI or state regulatory action or suspension" in result.missed_facts
+
+    def test_depth_weighted_score(self, overturf_state: ResearchState, hard_persona: Persona) -> None:
+        result = evaluate(overturf_state, hard_persona)
+        assert result.weighted_score == pytest.approx(0.6222, abs=1e-4)
+        assert result.depth_breakdown["depth_4"] == {"found": 2, "total": 2, "recall": 1.0}
+        assert result.depth_breakdown["depth_5"]["found"] == 3
+
+    def test_entity_recall_uses_aliases_and_substrings(
+        self, overturf_state: ResearchState, hard_persona: Persona
+    ) -> None:
+        result = evaluate(overturf_state, hard_persona)
+        assert result.matched_entities == ["Sisu Capital", "Timothy Overturf", "Hansueli Overturf"]
+        assert result.missed_entities == ["Hans Overturf"]
+
+    def test_entity_matching_ignores_case_and_follows_alias_edits(self, hard_persona: Persona) -> None:
+        state = ResearchState(subject=SubjectProfile(full_name="X", current_role="", current_organization=""))
+        tim = state.add_entity(Entity(name="TIMOTHY OVERTURF", entity_type=EntityType.PERSON, aliases=["Tim O."]))
+        assert evaluate(state, hard_persona).matched_entities == ["Timothy Overturf"]
+        tim.aliases[0] = "HANS OVERTURF"  # In-place, same-length alias edit
+        assert evaluate(state, hard_persona).matched_entities == ["Timothy Overturf", "Hans Overturf"]
+
+    def test_connection_recall(self, overturf_state: ResearchState, hard_persona: Persona) -> None:
+        result = evaluate(overturf_state, hard_persona)
+        # WORKS_AT and FOUNDED both resolve to the same Timothy -> Sisu edge; FAMILY_OF is missing
+        assert result.discovered_connections == 2
+        assert result.connection_recall == pytest.approx(2 / 3)
+
+    def test_empty_state(self, hard_persona: Persona) -> None:
+        state = ResearchState(subject=SubjectProfile(full_name="X", current_role="", current_organization=""))
+        result = evaluate(state, hard_persona)
+        assert result.fact_recall == 0.0
+        assert result.entity_recall == 0.0
+        assert result.connection_recall == 0.0
+
+    def test_fallback_scan_matches_automaton(
+        self, overturf_state: ResearchState, hard_persona: Persona, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(metrics, "_AUTOMATON_MIN_TERMS", 1)
+        expected = evaluate(overturf_state, hard_persona)
+        monkeypatch.setattr(metrics, "_HAS_AHOCORASICK", False)
+        metrics._RESULT_CACHE.clear()
+        result = evaluate(overturf_state, hard_persona)
+        assert result.matched_facts == expected.matched_facts
+        assert result.weighted_score == expected.weighted_score
+
+    def test_cached_until_state_changes(self, overturf_state: ResearchState, hard_persona: Persona) -> None:
+        first = evaluate(overturf_state, hard_persona)
+        assert evaluate(overturf_state, hard_persona) is first
+        overturf_state.add_entity(Entity(name="Hans Overturf", entity_type=EntityType.PERSON))
+        second = evaluate(overturf_state, hard_persona)
+        assert second is not first
+        assert second.missed_entities == []
+
+    def test_cache_keyed_on_persona_content(self, overturf_state: ResearchState, hard_persona: Persona) -> None:
+        first = evaluate(overturf_state, hard_persona)
+        same_name = dataclasses.replace(hard_persona, expected_entities=("Hans Overturf",))
+        second = evaluate(overturf_state, same_name)
+        assert second is not first
+        assert second.persona_name == first.persona_name
+        assert second.missed_entities == ["Hans Overturf"]
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            first.fact_recall = 1.0  # type: ignore[misc]
+        assert isinstance(first.fact_hits, tuple)
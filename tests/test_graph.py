@@ -1,8 +1,9 @@
 """Integration tests for LangGraph routing and graph structure."""
 
+import asyncio
 import json
 from pathlib import Path
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
@@ -10,9 +11,16 @@ from src.graph import ResearchGraph
 from src.models import (
     AgentAction,
     DirectorDecision,
+    Entity,
+    EntityType,
+    Hypothesis,
     ResearchState,
+    RiskCategory,
+    RiskFlag,
+    RiskSeverity,
     SearchPhase,
     SubjectProfile,
+    TemporalFact,
 )
 
 
@@ -44,28 +52,43 @@ class TestResearchGraphRouting:
         graph = ResearchGraph()
         state = ResearchState(subject=SubjectProfile(full_name="X", current_role="", current_organization=""))
         state.last_decision = _decision(AgentAction.SEARCH_WEB)
-        route = graph._route_from_director(state.model_dump())
+        route = graph._route_from_director(state)
         assert route == "web_research"
 
     def test_route_from_director_generate_report(self) -> None:
         graph = ResearchGraph()
         state = ResearchState(subject=SubjectProfile(full_name="X", current_role="", current_organization=""))
         state.should_terminate = True
-        route = graph._route_from_director(state.model_dump())
+        route = graph._route_from_director(state)
         assert route == "end"
 
     def test_route_from_director_risk_analysis(self) -> None:
         graph = ResearchGraph()
         state = ResearchState(subject=SubjectProfile(full_name="X", current_role="", current_organization=""))
         state.last_decision = _decision(AgentAction.ANALYZE_RISKS)
-        route = graph._route_from_director(state.model_dump())
+        route = graph._route_from_director(state)
         assert route == "risk_analysis"
 
+    def test_route_from_director_triangulation_keeps_single_analysis(self) -> None:
+        graph = ResearchGraph()
+        state = ResearchState(subject=SubjectProfile(full_name="X", current_role="", current_organization=""))
+        state.last_decision = _decision(AgentAction.MAP_CONNECTIONS)
+        state.last_decision.current_phase = SearchPhase.TRIANGULATION
+        route = graph._route_from_director(state)
+        assert route == "connection_mapping"
+
+    def test_route_from_director_analyze_all(self) -> None:
+        graph = ResearchGraph()
+        state = ResearchState(subject=SubjectProfile(full_name="X", current_role="", current_organization=""))
+        state.last_decision = _decision(AgentAction.ANALYZE_ALL)
+        route = graph._route_from_director(state)
+        assert route == "analysis"
+
     def test_route_from_director_no_decision_defaults_web_research(self) -> None:
         graph = ResearchGraph()
         state = ResearchState(subject=SubjectProfile(full_name="X", current_role="", current_organization=""))
         state.last_decision = None
-        route = graph._route_from_director(state.model_dump())
+        route = graph._route_from_director(state)
         assert route == "web_research"
 
 
@@ -77,9 +100,9 @@ class TestDebugSnapshots:
         """When debug=True, director node writes iteration_N.json to output_dir/subject_slug/."""
         graph = ResearchGraph(debug=True, output_dir=str(tmp_path))
         graph.director.plan_next_step = AsyncMock(return_value=_decision(AgentAction.GENERATE_REPORT))
-        state_dict = initial_state.model_dump()
-        result = await graph._director_node(state_dict)
-        assert result["iteration"] == 1
+        result = await graph._director_node(initial_state)
+        assert result.iteration == 1
+        await graph._flush_debug_writes()
         slug = "test_subject"
         snapshot_dir = tmp_path / slug
         assert snapshot_dir.is_dir()
@@ -88,3 +111,233 @@ class TestDebugSnapshots:
         data = json.loads(snapshot_file.read_text())
         assert data["iteration"] == 1
         assert data["subject"]["full_name"] == "Test Subject"
+        assert data["logs"][-1].startswith("Director planned: generate_report")
+        stage = json.loads((tmp_path / "pipeline_debug" / "step_001_director.json").read_text())
+        assert stage["in"]["iteration"] == 0
+        assert stage["out"] == data
+
+    @pytest.mark.asyncio
+    async def test_later_snapshots_only_carry_changed_fields(
+        self, initial_state: ResearchState, tmp_path: Path
+    ) -> None:
+        graph = ResearchGraph(debug=True, output_dir=str(tmp_path))
+        graph.director.plan_next_step = AsyncMock(return_value=_decision(AgentAction.SEARCH_WEB))
+        await graph._director_node(initial_state)
+        initial_state.add_entity(Entity(name="Test Corp", entity_type=EntityType.ORGANIZATION))
+        await graph._director_node(initial_state)
+        await graph._flush_debug_writes()
+        data = json.loads((tmp_path / "test_subject" / "iteration_2.json").read_text())
+        assert data["iteration"] == 2
+        assert [e["name"] for e in data["entities"]] == ["Test Corp"]
+        assert "connections" not in data
+        assert "connections" in data["unchanged_fields"]
+        assert "subject" in data["unchanged_fields"]
+
+    @pytest.mark.asyncio
+    async def test_pipeline_stage_in_and_out_written_as_one_file(
+        self, initial_state: ResearchState, tmp_path: Path
+    ) -> None:
+        graph = ResearchGraph(debug=True, output_dir=str(tmp_path))
+
+        async def extract_facts(state: ResearchState) -> ResearchState:
+            state.add_entity(Entity(name="Test Corp", entity_type=EntityType.ORGANIZATION))
+            return state
+
+        graph.fact_extractor.extract_facts = extract_facts
+        await graph._fact_extraction_node(initial_state)
+        await graph._flush_debug_writes()
+        files = sorted(p.name for p in (tmp_path / "pipeline_debug").iterdir())
+        assert files == ["step_001_fact_extraction.json"]
+        data = json.loads((tmp_path / "pipeline_debug" / files[0]).read_text())
+        assert data["step"] == 1
+        assert data["node"] == "fact_extraction"
+        assert data["in"]["entities"] == []
+        assert [e["name"] for e in data["out"]["entities"]] == ["Test Corp"]
+
+
+class TestProgressCallback:
+    """on_progress receives a dict view of the state after each node."""
+
+    @pytest.mark.asyncio
+    async def test_on_progress_receives_state_fields(self, initial_state: ResearchState) -> None:
+        received: list[tuple[str, dict]] = []
+        graph = ResearchGraph(on_progress=lambda node, state: received.append((node, state)))
+
+        async def extract_facts(state: ResearchState) -> ResearchState:
+            state.add_entity(Entity(name="Test Corp", entity_type=EntityType.ORGANIZATION))
+            return state
+
+        graph.fact_extractor.extract_facts = extract_facts
+        await graph._fact_extraction_node(initial_state)
+        assert [node for node, _ in received] == ["fact_extraction"]
+        state_view = received[0][1]
+        assert [e.name for e in state_view["entities"]] == ["Test Corp"]
+        assert state_view["current_phase"] == SearchPhase.BASELINE
+        assert state_view["iteration"] == 0
+
+
+class TestSynthesis:
+    """Sub-nodes that run concurrently share one state and write disjoint fields."""
+
+    @pytest.mark.asyncio
+    async def test_temporal_facts_reference_resolved_entities(self, initial_state: ResearchState) -> None:
+        graph = ResearchGraph()
+        initial_state.entities = [Entity(name=f"E{i}", entity_type=EntityType.PERSON) for i in range(16)]
+        initial_state.entities.append(Entity(name="Test Corp Inc", entity_type=EntityType.ORGANIZATION))
+        initial_state.entities.append(Entity(name="Test Corp", entity_type=EntityType.ORGANIZATION))
+        survivor, merged = initial_state.entities[-2:]
+
+        async def resolve(state: ResearchState) -> ResearchState:
+            await asyncio.sleep(0)
+            graph.entity_resolver._merge_entities(
+                state, [{"entity_a_id": survivor.id, "entity_b_id": merged.id, "confidence": 0.9}]
+            )
+            return state
+
+        async def analyze_timeline(state: ResearchState) -> ResearchState:
+            corp = state.find_entity_by_name("Test Corp")
+            assert corp is not None
+            state.temporal_facts.append(TemporalFact(claim="Founded Test Corp", entity_id=corp.id))
+            return state
+
+        graph.entity_resolver.resolve = resolve
+        graph.temporal_analyzer.analyze_timeline = analyze_timeline
+        graph._ensure_neo4j = AsyncMock(return_value=MagicMock())
+        graph._update_graph_db_node = AsyncMock(side_effect=lambda state, neo4j=None: state)
+        graph._graph_reasoning_node = AsyncMock(side_effect=lambda state, neo4j=None: state)
+        graph._generate_report_node = AsyncMock(side_effect=lambda state: state)
+        out = await graph._synthesis_node(initial_state)
+        assert [t.entity_id for t in out.temporal_facts] == [survivor.id]
+        assert out.get_entity_by_id(merged.id) is None
+
+    @pytest.mark.asyncio
+    async def test_analysis_node_runs_all_workers(self, initial_state: ResearchState) -> None:
+        graph = ResearchGraph()
+
+        async def analyze_risks(state: ResearchState) -> ResearchState:
+            state.risk_debate_transcript.append({"role": "judge", "argument": "none"})
+            state.total_llm_calls += 1
+            return state
+
+        async def map_connections(state: ResearchState) -> ResearchState:
+            state.hypotheses.append(Hypothesis(description="Check board seats"))
+            state.total_llm_calls += 1
+            return state
+
+        async def verify_sources(state: ResearchState) -> ResearchState:
+            state.overall_confidence = 0.7
+            state.total_llm_calls += 1
+            return state
+
+        graph.risk_analyzer.analyze_risks = analyze_risks
+        graph.connection_mapper.map_connections = map_connections
+        graph.source_verifier.verify_sources = verify_sources
+        out = await graph._analysis_node(initial_state)
+        assert len(out.risk_debate_transcript) == 1
+        assert [h.description for h in out.hypotheses] == ["Check board seats"]
+        assert out.overall_confidence == 0.7
+        assert out.total_llm_calls == 3
+
+
+class TestGraphDiscovery:
+    """Inline discovery after persisting state to Neo4j."""
+
+    @pytest.mark.asyncio
+    async def test_shortest_paths_batched_and_survive_other_query_failure(self, initial_state: ResearchState) -> None:
+        graph = ResearchGraph()
+        graph._enable_graph_db = True
+        subject = initial_state.add_entity(Entity(name="Test Subject", entity_type=EntityType.PERSON))
+        shell = initial_state.add_entity(Entity(name="Shell Co", entity_type=EntityType.ORGANIZATION))
+        initial_state.risk_flags.append(
+            RiskFlag(
+                category=RiskCategory.REGULATORY,
+                severity=RiskSeverity.HIGH,
+                title="Sanctions exposure",
+                description="test",
+                entity_ids=[subject.id, shell.id],
+            )
+        )
+        path = {"entity_chain": ["Test Subject", "Shell Co"], "relationship_chain": ["OWNS"], "hops": 1}
+        client = MagicMock(is_connected=True)
+        client.clear_graph = AsyncMock()
+        client.persist_state = AsyncMock(return_value={"nodes": 2, "relationships": 1})
+        client.degree_centrality = AsyncMock(side_effect=RuntimeError("query timeout"))
+        client.shortest_paths = AsyncMock(return_value={"Shell Co": [path]})
+        client.detect_shell_companies = AsyncMock(return_value=[])
+        out = await graph._update_graph_db_node(initial_state, neo4j=client)
+        client.shortest_paths.assert_awaited_once_with("Test Subject", ["Shell Co"])
+        assert out.graph_db_populated is True
+        assert out.graph_insights == [
+            {"type": "shortest_path", "from": "Test Subject", "to": "Shell Co", "data": [path]}
+        ]
+
+
+class TestStateCarriage:
+    """The graph hands nodes the caller's ResearchState object; no per-node dump/validate round trip."""
+
+    @pytest.mark.asyncio
+    async def test_nodes_receive_the_same_state_object(self, initial_state: ResearchState) -> None:
+        graph = ResearchGraph()
+        graph.director.plan_next_step = AsyncMock(return_value=_decision(AgentAction.ANALYZE_RISKS))
+        seen: list[ResearchState] = []
+
+        async def analyze_risks(state: ResearchState) -> ResearchState:
+            seen.append(state)
+            raise RuntimeError("stop")
+
+        graph.risk_analyzer.analyze_risks = analyze_risks
+        with pytest.raises(RuntimeError, match="stop"):
+            await graph.graph.ainvoke(initial_state, config={"configurable": {"thread_id": "carry"}})
+        assert seen == [initial_state]
+        assert seen[0] is initial_state
+        assert initial_state.iteration == 1
+
+
+class TestCheckpointRecovery:
+    """A failed run is recovered from the checkpoint written when the graph exits."""
+
+    @pytest.mark.asyncio
+    async def test_investigate_recovers_last_state_on_error(self, tmp_path: Path) -> None:
+        graph = ResearchGraph(output_dir=str(tmp_path))
+        graph.director.plan_next_step = AsyncMock(return_value=_decision(AgentAction.ANALYZE_RISKS))
+        graph.risk_analyzer.analyze_risks = AsyncMock(side_effect=RuntimeError("LLM down"))
+        final_state = await graph.investigate("Test Subject", max_iterations=2)
+        assert final_state.iteration == 1
+        assert final_state.last_decision is not None
+        assert final_state.error_log[-1] == "Investigation failed: LLM down"
+
+    @pytest.mark.asyncio
+    async def test_checkpoints_kept_for_most_recent_threads_only(self, initial_state: ResearchState) -> None:
+        graph = ResearchGraph()
+        graph._checkpointer.max_threads = 2
+        graph.director.plan_next_step = AsyncMock(return_value=_decision(AgentAction.ANALYZE_RISKS))
+        graph.risk_analyzer.analyze_risks = AsyncMock(side_effect=RuntimeError("stop"))
+        for thread_id in ("a", "b", "c"):
+            with pytest.raises(RuntimeError):
+                await graph.graph.ainvoke(
+                    initial_state, config={"configurable": {"thread_id": thread_id}}, durability="exit"
+                )
+        assert set(graph._checkpointer.storage) == {"b", "c"}
+        assert graph._checkpointer.get({"configurable": {"thread_id": "a"}}) is None
+        assert graph._checkpointer.get({"configurable": {"thread_id": "c"}}) is not None
+
+
+class TestProgressStream:
+    """Progress events are appended as JSON lines through one buffered descriptor per investigation."""
+
+    @pytest.mark.asyncio
+    async def test_progress_events_written_and_file_closed(self, tmp_path: Path) -> None:
+        graph = ResearchGraph(output_dir=str(tmp_path))
+        graph.director.plan_next_step = AsyncMock(return_value=_decision(AgentAction.ANALYZE_RISKS))
+        graph.risk_analyzer.analyze_risks = AsyncMock(side_effect=RuntimeError("LLM down"))
+        await graph.investigate("Test Subject", max_iterations=2)
+        lines = (tmp_path / "test_subject_progress.jsonl").read_text(encoding="utf-8").splitlines()
+        events = [json.loads(line) for line in lines]
+        assert events[0]["event"] == "node_start"
+        assert events[0]["node"] == "director"
+        assert all("ts" in e for e in events)
+        assert graph._progress_fp is None
+        assert graph._progress_flusher is None
+        meta = json.loads((tmp_path / "test_subject_metadata.json").read_text(encoding="utf-8"))
+        assert meta["termination_reason"] == "error"
+        assert not list(tmp_path.glob("*.tmp"))
@@ -0,0 +1,279 @@
+"""Unit tests for Neo4jClient statement batching (no live database; the driver records what it is sent)."""
+
+import asyncio
+from typing import Any
+
+import pytest
+
+from src.graph_db import neo4j_client
+from src.graph_db.neo4j_client import Neo4jClient
+from src.models import (
+    Connection,
+    Entity,
+    EntityType,
+    RelationshipType,
+    ResearchState,
+    RiskCategory,
+    RiskFlag,
+    RiskSeverity,
+    SubjectProfile,
+)
+
+
+class _FakeRecord:
+    def __init__(self, data: dict[str, Any]) -> None:
+        self._data = data
+
+    def data(self) -> dict[str, Any]:
+        return dict(self._data)
+
+
+class _FakeResult:
+    def __init__(self, records: list[dict[str, Any]] | None = None) -> None:
+        self._records = iter(records or [])
+
+    async def consume(self) -> None:
+        return None
+
+    async def data(self) -> list[dict[str, Any]]:
+        return [dict(record) for record in self._records]
+
+    def __aiter__(self) -> "_FakeResult":
+        return self
+
+    async def __anext__(self) -> _FakeRecord:
+        try:
+            return _FakeRecord(next(self._records))
+        except StopIteration:
+            raise StopAsyncIteration from None
+
+
+class _FakeSession:
+    def __init__(self, driver: "_FakeDriver") -> None:
+        self._driver = driver
+
+    async def __aenter__(self) -> "_FakeSession":
+        return self
+
+    async def __aexit__(self, *exc: object) -> None:
+        return None
+
+    async def run(self, cypher: str, parameters: dict[str, Any] | None = None, **kwargs: Any) -> _FakeResult:
+        self._driver.calls.append((cypher, {**(parameters or {}), **kwargs}))
+        return _FakeResult(self._driver.records)
+
+    async def execute_write(self, work: Any, *args: Any) -> Any:
+        self._driver.transactions += 1
+        return await work(self, *args)  # The session doubles as the managed transaction
+
+
+class _FakeDriver:
+    def __init__(self) -> None:
+        self.calls: list[tuple[str, dict[str, Any]]] = []
+        self.sessions = 0
+        self.transactions = 0
+        self.records: list[dict[str, Any]] = []  # Returned by every query
+
+    def session(self, **kwargs: Any) -> _FakeSession:
+        self.sessions += 1
+        return _FakeSession(self)
+
+
+@pytest.fixture
+def client() -> Neo4jClient:
+    client = Neo4jClient()
+    client._driver = _FakeDriver()  # type: ignore[assignment]
+    return client
+
+
+@pytest.fixture
+def state() -> ResearchState:
+    state = ResearchState(
+        subject=SubjectProfile(full_name="Test Subject", current_role="CEO", current_organization="Test Corp")
+    )
+    subject = state.add_entity(Entity(name="Test Subject", entity_type=EntityType.PERSON))
+    corp = state.add_entity(Entity(name="Test Corp", entity_type=EntityType.ORGANIZATION))
+    fund = state.add_entity(Entity(name="Test Fund", entity_type=EntityType.ORGANIZATION))
+    for target in (corp, fund):
+        state.add_connection(
+            Connection(
+                source_entity_id=subject.id,
+                target_entity_id=target.id,
+                relationship_type=RelationshipType.WORKS_AT,
+                source_urls=["https://example.com/a"],
+                start_date="2020",
+            )
+        )
+    state.risk_flags.append(
+        RiskFlag(
+            category=RiskCategory.REGULATORY,
+            severity=RiskSeverity.HIGH,
+            title="Sanctions exposure",
+            description="test",
+            entity_ids=[subject.id, corp.id, "missing"],
+        )
+    )
+    return state
+
+
+class TestPersistState:
+    """persist_state sends one UNWIND statement per label / relationship group, not one per row."""
+
+    @pytest.mark.asyncio
+    async def test_rows_batched_per_group(self, client: Neo4jClient, state: ResearchState) -> None:
+        counts = await client.persist_state(state)
+        assert counts == {"nodes": 4, "relationships": 4}
+        # One session for schema, edges and links; one each for the concurrent Person/Organization/RiskFlag writes
+        assert client._driver.sessions == 4  # type: ignore[union-attr]
+        writes = [(c, p) for c, p in client._driver.calls if c.startswith("UNWIND")]  # type: ignore[union-attr]
+        assert len(writes) == 6  # Person, Organization, WORKS_AT edges, RiskFlag, 2 FLAGGED_FOR label groups
+        assert client._driver.transactions == len(writes)  # type: ignore[union-attr]
+        edge_cypher, edge_params = next((c, p) for c, p in writes if "WORKS_AT" in c)
+        assert "MATCH (a:Person" in edge_cypher and "MATCH (b:Organization" in edge_cypher
+        assert len(edge_params["rows"]) == 2
+        props = edge_params["rows"][0]["props"]
+        assert props["source_url_primary"] == "https://example.com/a"
+        assert props["start_date"] == "2020"
+        assert props["extraction_timestamp"] == props["updated_at"]
+
+    @pytest.mark.asyncio
+    async def test_fresh_graph_creates_nodes_and_merges_edges(self, client: Neo4jClient, state: ResearchState) -> None:
+        state.entities.append(state.entities[0])  # A repeated entity is written once
+        counts = await client.persist_state(state, fresh_graph=True)
+        assert counts["nodes"] == 4
+        writes = [c for c, _ in client._driver.calls if c.startswith("UNWIND")]  # type: ignore[union-attr]
+        assert sum("CREATE (n:" in c or "CREATE (r:RiskFlag)" in c for c in writes) == 3
+        assert all("MERGE (a)-[r:" in c for c in writes if "WORKS_AT" in c)
+
+    @pytest.mark.asyncio
+    async def test_repeated_connections_and_links_sent_once(self, client: Neo4jClient, state: ResearchState) -> None:
+        repeat = state.connections[0].model_copy(update={"description": "latest"})
+        state.connections.append(repeat)
+        state.risk_flags[0].entity_ids.append(state.risk_flags[0].entity_ids[0])
+        counts = await client.persist_state(state)
+        assert counts == {"nodes": 4, "relationships": 4}
+        rows = next(p["rows"] for c, p in client._driver.calls if "WORKS_AT" in c)  # type: ignore[union-attr]
+        assert len(rows) == 2
+        assert rows[0]["props"]["description"] == "latest"
+
+    @pytest.mark.asyncio
+    async def test_failed_node_group_cancels_the_others(
+        self, client: Neo4jClient, state: ResearchState, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        cancelled: list[str] = []
+
+        async def write_rows(cypher: str, rows: list[dict[str, Any]], session: Any = None) -> None:
+            if "Person" in cypher:
+                raise RuntimeError("write failed")
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.append(cypher)
+                raise
+
+        monkeypatch.setattr(client, "_write_rows", write_rows)
+        with pytest.raises(RuntimeError, match="write failed"):
+            await client.persist_state(state)
+        assert len(cancelled) == 2  # Organization and RiskFlag writes, settled before persist_state returned
+
+    @pytest.mark.asyncio
+    async def test_not_connected_skips(self, state: ResearchState) -> None:
+        assert await Neo4jClient().persist_state(state) == {"nodes": 0, "relationships": 0}
+
+    @pytest.mark.asyncio
+    async def test_schema_created_once_per_driver(self, client: Neo4jClient, state: ResearchState) -> None:
+        await client.persist_state(state)
+        await client.persist_state(state)
+        ddl = [c for c, _ in client._driver.calls if c.startswith("CREATE CONSTRAINT")]  # type: ignore[union-attr]
+        assert len(ddl) == 8  # entity_id on each of the 7 entity labels, flag_id on RiskFlag
+        assert any("(n:Location) REQUIRE n.entity_id" in c for c in ddl)
+
+    @pytest.mark.asyncio
+    async def test_large_groups_split_into_row_batches(
+        self, client: Neo4jClient, state: ResearchState, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(neo4j_client, "WRITE_BATCH_ROWS", 1)
+        await client.persist_state(state)
+        edge_writes = [p for c, p in client._driver.calls if "WORKS_AT" in c]  # type: ignore[union-attr]
+        assert [len(p["rows"]) for p in edge_writes] == [1, 1]
+
+
+class TestReadCache:
+    """Read queries are served from a short-lived cache until this client writes to the graph."""
+
+    @pytest.mark.asyncio
+    async def test_repeat_reads_cached_until_graph_cleared(self, client: Neo4jClient) -> None:
+        client._driver.records.append({"name": "Test Corp", "type": "organization", "degree": 3})  # type: ignore[union-attr]
+        first = await client.degree_centrality(top_n=5)
+        first[0]["degree"] = 99  # Callers get their own copy; the cached rows are unaffected
+        first.append({"name": "extra"})
+        assert await client.degree_centrality(top_n=5) == [{"name": "Test Corp", "type": "organization", "degree": 3}]
+        assert len(client._driver.calls) == 1  # type: ignore[union-attr]
+        await client.degree_centrality(top_n=10)
+        assert len(client._driver.calls) == 2  # type: ignore[union-attr]
+        await client.clear_graph()
+        await client.degree_centrality(top_n=5)
+        assert len(client._driver.calls) == 4  # type: ignore[union-attr]
+
+    @pytest.mark.asyncio
+    async def test_expired_entries_refetched(
+        self, client: Neo4jClient, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(neo4j_client, "READ_CACHE_TTL_S", -1.0)
+        await client.query_connections("Test Subject")
+        await client.query_connections("Test Subject")
+        assert len(client._driver.calls) == 2  # type: ignore[union-attr]
+
+
+class TestBulkRead:
+    """Independent reads run concurrently; each spec gets its rows (or its exception) in order."""
+
+    @pytest.mark.asyncio
+    async def test_results_in_spec_order_and_failures_isolated(
+        self, client: Neo4jClient, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        async def execute_read(cypher: str, parameters: dict[str, Any] | None = None) -> list[dict[str, Any]]:
+            if cypher == "bad":
+                raise RuntimeError("syntax error")
+            return [{"q": cypher, **(parameters or {})}]
+
+        monkeypatch.setattr(client, "execute_read", execute_read)
+        results = await client.bulk_read([("a", {"n": 1}), ("bad", None), ("b", None)])
+        assert results[0] == [{"q": "a", "n": 1}]
+        assert isinstance(results[1], RuntimeError)
+        assert results[2] == [{"q": "b"}]
+
+    @pytest.mark.asyncio
+    async def test_in_flight_reads_bounded_by_pool_size(
+        self, client: Neo4jClient, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        in_flight = peak = 0
+
+        async def execute_read(cypher: str, parameters: dict[str, Any] | None = None) -> list[dict[str, Any]]:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return []
+
+        monkeypatch.setattr(client, "execute_read", execute_read)
+        client._pool_size = 2
+        await client.bulk_read([("q", None)] * 6)
+        assert peak == 2
+
+
+class TestEntityProps:
+    """Entity attributes keep their native types where Neo4j can store them."""
+
+    def test_attribute_values(self) -> None:
+        entity = Entity(
+            name="Test Corp",
+            entity_type=EntityType.ORGANIZATION,
+            attributes={"location": "Austin", "employees": 12, "tickers": ["TC", "TCX"], "meta": {"k": 1}},
+        )
+        props = neo4j_client._entity_props(entity, "inv", "ts")
+        assert props["location"] == "Austin"
+        assert props["employees"] == 12
+        assert props["tickers"] == ["TC", "TCX"]
+        assert props["meta"] == '{"k":1}'